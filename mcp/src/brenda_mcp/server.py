@@ -13,13 +13,33 @@ Run it (stdio transport, the default):
     PYTHONPATH=src BRENDA_DATABASE_PATH=... python -m brenda_mcp.server
 
 The database is parsed lazily on the first tool call and cached for the life of
-the process.
+the process. With ``--preload`` (or ``BRENDA_MCP_PRELOAD=1``) loading starts in
+the background as soon as the server starts; tool calls wait for it to finish,
+while ``get_database_info`` reports its progress.
+
+Tool calls never block the event loop: each runs in a bounded pool of worker
+threads (``BRENDA_MCP_WORKERS``, default 8), and the slow database-wide tools
+are further limited to a few concurrent calls each, so cheap lookups such as
+``get_enzyme`` stay responsive while a large scan is in flight. A call that
+the client cancels, or that exceeds ``BRENDA_MCP_TOOL_TIMEOUT`` seconds (unset:
+no limit), returns at once; its worker thread finishes in the background and
+counts against both limits until it does.
+
+Results are cached per release and arguments (``BRENDA_MCP_CACHE_SIZE`` results,
+default 256, optionally expiring after ``BRENDA_MCP_CACHE_TTL`` seconds), so an
+agent repeating a call gets the earlier answer; ``get_cache_stats`` reports the
+hit/miss counters.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal, Optional
 
+import anyio
 from mcp.server.fastmcp import FastMCP
 
 from . import service
@@ -45,6 +65,77 @@ in mM^-1 s^-1, specific activity in umol/min/mg, temperature in degC.
 
 mcp = FastMCP("brenda", instructions=INSTRUCTIONS)
 
+# Worker threads shared by all tool calls.
+WORKERS_ENV = "BRENDA_MCP_WORKERS"
+# Seconds after which a tool call is abandoned with an error (unset: no limit).
+TOOL_TIMEOUT_ENV = "BRENDA_MCP_TOOL_TIMEOUT"
+
+_workers = ThreadPoolExecutor(
+    int(os.environ.get(WORKERS_ENV, "8")), thread_name_prefix="brenda-mcp"
+)
+_tool_timeout = (
+    float(os.environ[TOOL_TIMEOUT_ENV]) if os.environ.get(TOOL_TIMEOUT_ENV) else None
+)
+
+
+def _offloaded(concurrency: Optional[int] = None):
+    """Turn a blocking tool function into a coroutine that runs it in the
+    worker pool, with at most ``concurrency`` calls of this tool at a time
+    (``None``: only bounded by the pool)."""
+
+    def decorate(func):
+        slots = asyncio.Semaphore(concurrency) if concurrency else None
+
+        @functools.wraps(func)
+        async def tool(*args, **kwargs):
+            call = functools.partial(func, *args, **kwargs)
+            with anyio.move_on_after(_tool_timeout):
+                return await _run(call, slots)
+            raise TimeoutError(
+                f"{func.__name__} did not finish within {_tool_timeout:g} seconds"
+            )
+
+        return tool
+
+    return decorate
+
+
+async def _run(call, slots: Optional[asyncio.Semaphore] = None):
+    # A cancelled or timed-out call returns immediately instead of waiting for
+    # its thread (Python threads cannot be interrupted). The thread keeps its
+    # place in the pool, and the call its slot, until it actually finishes, so
+    # abandoned calls still count against both limits.
+    loop = asyncio.get_running_loop()
+
+    def release() -> None:
+        if slots is not None:
+            try:
+                loop.call_soon_threadsafe(slots.release)
+            except RuntimeError:  # event loop already closed
+                pass
+
+    def work():
+        try:
+            return call()
+        finally:
+            release()
+
+    if slots is not None:
+        await slots.acquire()
+    try:
+        future = _workers.submit(work)
+    except BaseException:
+        if slots is not None:
+            slots.release()
+        raise
+    try:
+        return await asyncio.wrap_future(future)
+    except BaseException:
+        if future.cancel() and slots is not None:  # never started
+            slots.release()
+        raise
+
+
 # Parameter vocabularies, surfaced to the model as JSON-schema enums.
 KineticParam = Literal["km", "kcat", "ki", "kcat_km", "specific_activity"]
 ConditionProperty = Literal["temperature", "ph"]
@@ -65,27 +156,38 @@ DistributionParam = Literal[
 
 
 @mcp.tool()
+@_offloaded()
 def get_database_info() -> dict:
     """Return BRENDA release, JSON schema version, number of enzyme entries and
     the copyright notice. Useful as a first call to confirm the database is
-    loaded and see which release the answers come from."""
+    loaded and see which release the answers come from. While the database is
+    still loading, returns `status: "loading"` with the progress instead (stage,
+    bytes read, entries parsed, estimated seconds left)."""
     return service.database_info()
 
 
 @mcp.tool()
-def search_enzymes(query: str, limit: int = 25) -> dict:
-    """Find enzymes by a substring of their EC number, recommended name, or any
-    synonym. Use this when you have an enzyme name (e.g. "pyruvate kinase") but
-    not its EC number.
+@_offloaded(concurrency=4)
+@service.cached
+def search_enzymes(query: str, limit: int = 25, offset: int = 0) -> dict:
+    """Find enzymes by a substring of their EC number, recommended name,
+    systematic name, or any synonym. Use this when you have an enzyme name
+    (e.g. "pyruvate kinase") but not its EC number. Exact matches come first,
+    then prefix matches, then other substring matches; each result says which
+    kind of match and which field it is. `total` counts all matches: page
+    through them with `offset`.
 
     Args:
         query: Text to search for, case-insensitive (e.g. "alcohol dehydrogenase").
         limit: Maximum number of matches to return.
+        offset: Number of ranked matches to skip, for the next page.
     """
-    return service.search_enzymes(query, limit=limit)
+    return service.search_enzymes(query, limit=limit, offset=offset)
 
 
 @mcp.tool()
+@_offloaded()
+@service.cached
 def get_enzyme(ec_number: str) -> dict:
     """Overview of a single enzyme: name, systematic name, catalysed reaction,
     reaction type, synonyms, number of source organisms, and a `data_available`
@@ -100,6 +202,8 @@ def get_enzyme(ec_number: str) -> dict:
 
 
 @mcp.tool()
+@_offloaded()
+@service.cached
 def get_enzyme_kinetics(
     ec_number: str,
     parameter: KineticParam,
@@ -136,6 +240,8 @@ def get_enzyme_kinetics(
 
 
 @mcp.tool()
+@_offloaded()
+@service.cached
 def get_enzyme_conditions(
     ec_number: str,
     property: ConditionProperty,
@@ -157,6 +263,8 @@ def get_enzyme_conditions(
 
 
 @mcp.tool()
+@_offloaded()
+@service.cached
 def get_enzyme_compounds(ec_number: str, kind: CompoundKind, limit: int = 100) -> dict:
     """List the cofactors, inhibitors, activators, metals/ions, natural
     substrate-product pairs, or synonyms recorded for one enzyme.
@@ -171,6 +279,8 @@ def get_enzyme_compounds(ec_number: str, kind: CompoundKind, limit: int = 100) -
 
 
 @mcp.tool()
+@_offloaded()
+@service.cached
 def get_enzyme_organisms(ec_number: str, limit: int = 100) -> dict:
     """List the source organisms in which this enzyme has been characterised.
 
@@ -183,6 +293,8 @@ def get_enzyme_organisms(ec_number: str, limit: int = 100) -> dict:
 
 
 @mcp.tool()
+@_offloaded()
+@service.cached
 def get_enzyme_references(ec_number: str, limit: int = 25) -> dict:
     """Return the literature citations (with PubMed IDs where available) for one
     enzyme.
@@ -196,6 +308,8 @@ def get_enzyme_references(ec_number: str, limit: int = 25) -> dict:
 
 
 @mcp.tool()
+@_offloaded(concurrency=2)
+@service.cached
 def find_enzymes_by_compound(
     compound: str, role: CompoundRole = "any", limit: int = 25
 ) -> dict:
@@ -212,6 +326,8 @@ def find_enzymes_by_compound(
 
 
 @mcp.tool()
+@_offloaded(concurrency=2)
+@service.cached
 def find_enzymes_by_organism(organism: str, limit: int = 25) -> dict:
     """Find enzymes characterised in a given organism or taxon. Matching is a
     case-insensitive substring of the organism name, so a genus like
@@ -225,6 +341,8 @@ def find_enzymes_by_organism(organism: str, limit: int = 25) -> dict:
 
 
 @mcp.tool()
+@_offloaded(concurrency=1)
+@service.cached
 def compute_parameter_distribution(
     parameter: DistributionParam,
     organism: Optional[str] = None,
@@ -236,8 +354,8 @@ def compute_parameter_distribution(
     species subset, returning summary statistics and a histogram. This answers
     population-level questions such as "what is the median KM in BRENDA?" or "do
     enzymes in the genus Thermotoga have higher optimal temperatures than the
-    database as a whole?". Note: this scans many enzymes and may take several
-    seconds on the full database.
+    database as a whole?". The first call builds a value table of the whole
+    database (a few seconds on the full release); later calls are fast.
 
     Args:
         parameter: km, kcat, ki, kcat_km, specific_activity, temperature_optimum, or ph_optimum.
@@ -255,10 +373,36 @@ def compute_parameter_distribution(
     )
 
 
-def main() -> None:
+@mcp.tool()
+@_offloaded()
+def get_cache_stats() -> dict:
+    """Hit/miss counters, size and limits of the server's result cache, which
+    answers repeated calls with identical arguments without recomputing them.
+    The cache is emptied whenever the database is reloaded."""
+    return service.cache_stats()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
     """Console-script entry point: run the server over stdio."""
+    import argparse
     import logging
-    import os
+
+    parser = argparse.ArgumentParser(
+        prog="brenda-mcp", description="BRENDA MCP server (stdio transport)."
+    )
+    parser.add_argument(
+        "--preload",
+        action="store_true",
+        help="start loading the database in the background right away "
+        f"(also enabled by {service.PRELOAD_ENV}=1)",
+    )
+    args = parser.parse_args(argv)
+    if args.preload or os.environ.get(service.PRELOAD_ENV, "").lower() in (
+        "1",
+        "true",
+        "yes",
+    ):
+        service.start_background_load()
 
     # Quiet the per-request INFO chatter from the MCP runtime unless debugging.
     # (Our own progress messages in service._log go straight to stderr.)
@@ -4,7 +4,9 @@ Service layer for the BRENDA MCP server.
 Wraps the :class:`brendapyrser.BRENDA` API with:
 
 * a lazily-loaded, process-wide cached database (the BRENDA JSON is large, so we
-  parse it once on first use), and
+  parse it once on first use, or in the background from server start with
+  :func:`start_background_load`),
+* a bounded cache of tool results (see :func:`cached`), and
 * helpers that turn the rich Python objects into compact, JSON-serialisable
   summaries — statistics and histograms rather than thousands of raw numbers —
   so tool results stay small enough to be cheap for an LLM to read.
@@ -15,18 +17,29 @@ definitions on top.
 
 from __future__ import annotations
 
+import functools
+import inspect
 import math
 import os
-import statistics
 import sys
 import threading
+import time
+from collections import OrderedDict
 from typing import Any, Iterable, Optional
 
+import numpy as np
+
 from brendapyrser import BRENDA
 
 # Environment variable pointing at the BRENDA JSON database. Accepts a plain
 # ``.json`` file, a ``.json.gz``, or the ``.json.tar.gz`` archive BRENDA ships.
 DB_PATH_ENV = "BRENDA_DATABASE_PATH"
+# Set (to 1/true/yes) to start loading the database as soon as the server starts.
+PRELOAD_ENV = "BRENDA_MCP_PRELOAD"
+# Number of tool results kept by the result cache (0 disables it), and the
+# seconds after which a cached result expires (unset: never).
+CACHE_SIZE_ENV = "BRENDA_MCP_CACHE_SIZE"
+CACHE_TTL_ENV = "BRENDA_MCP_CACHE_TTL"
 
 # Units for each queryable quantity (mirrors brendapyrser.constants.units, with
 # the temperature/pH conditions added).
@@ -52,8 +65,24 @@ _KINETIC_PROPERTY = {
     "kcat_km": "KKMvalues",
 }
 
+# parameter name -> BRENDA field aggregated by parameter_distribution
+_DISTRIBUTION_FIELD = {
+    "km": "km_value",
+    "kcat": "turnover_number",
+    "ki": "ki_value",
+    "kcat_km": "kcat_km_value",
+    "specific_activity": "specific_activity",
+    "temperature_optimum": "temperature_optimum",
+    "ph_optimum": "ph_optimum",
+}
+
 _brenda: Optional[BRENDA] = None
 _lock = threading.Lock()
+_loading: Optional[_LoadProgress] = None
+_parameter_tables: Optional[_ParameterTable] = None
+_parameter_tables_lock = threading.Lock()
+_search_indexes: Optional[_SearchIndex] = None
+_search_indexes_lock = threading.Lock()
 
 
 def _log(msg: str) -> None:
@@ -61,13 +90,67 @@ def _log(msg: str) -> None:
     print(f"[brenda-mcp] {msg}", file=sys.stderr, flush=True)
 
 
+class _LoadProgress:
+    """Progress of a database load, fed by :class:`BRENDA`'s ``progress``
+    callback: the file is read, then decoded, then its entries are turned into
+    reactions."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.bytes_read = 0
+        self.total_bytes = 0
+        self.entries = 0
+        self.total_entries: Optional[int] = None
+        self.building_since: Optional[float] = None
+
+    def update(
+        self,
+        bytes_read: int,
+        total_bytes: int,
+        entries: int,
+        total_entries: Optional[int],
+    ) -> None:
+        if entries and self.building_since is None:
+            self.building_since = time.monotonic()
+        self.bytes_read = bytes_read
+        self.total_bytes = total_bytes
+        self.entries = entries
+        self.total_entries = total_entries
+
+    def report(self) -> dict[str, Any]:
+        now = time.monotonic()
+        if self.building_since is not None:
+            stage = "building reactions"
+        elif not self.total_bytes:
+            stage = "starting"
+        elif self.bytes_read < self.total_bytes:
+            stage = "reading file"
+        else:
+            stage = "decoding JSON"
+        eta = None
+        # Only the last (and longest) stage advances at a measurable rate.
+        if self.building_since is not None and self.total_entries:
+            rate = self.entries / max(now - self.building_since, 1e-9)
+            eta = round((self.total_entries - self.entries) / rate, 1)
+        return {
+            "stage": stage,
+            "bytes_read": self.bytes_read,
+            "total_bytes": self.total_bytes,
+            "entries_parsed": self.entries,
+            "total_entries": self.total_entries,
+            "elapsed_seconds": round(now - self.started, 1),
+            "eta_seconds": eta,
+        }
+
+
 def get_brenda(path: Optional[str] = None) -> BRENDA:
     """
     Return the shared :class:`BRENDA` instance, parsing the database on first
     use. ``path`` overrides the ``BRENDA_DATABASE_PATH`` environment variable
-    (used by the test suite to point at the small fixture).
+    (used by the test suite to point at the small fixture). While another
+    thread is loading the shared database, this waits for it.
     """
-    global _brenda
+    global _brenda, _loading
     if _brenda is not None and path is None:
         return _brenda
 
@@ -86,47 +169,171 @@ def get_brenda(path: Optional[str] = None) -> BRENDA:
         if _brenda is not None and path is None:
             return _brenda
         _log(f"loading BRENDA database from {db_path} (this can take a while) ...")
-        brenda = BRENDA(db_path)
+        progress = _LoadProgress()
+        if path is None:
+            # Keep the progress published by start_background_load, if any.
+            progress = _loading or progress
+            _loading = progress
+        try:
+            brenda = BRENDA(db_path, progress=progress.update)
+        finally:
+            if path is None:
+                _loading = None
         _log(
             f"loaded release {brenda.release!r}: "
             f"{len(brenda.reactions)} enzyme entries."
         )
         if path is None:
+            _search_index(brenda)
             _brenda = brenda
         return brenda
 
 
+def start_background_load() -> threading.Thread:
+    """Start loading the shared database on a daemon thread, so that it is
+    ready (or closer to it) by the first tool call. Tool calls made meanwhile
+    wait in :func:`get_brenda`; a failed load is logged and retried, raising
+    the error, by the next call."""
+    global _loading
+
+    def load() -> None:
+        try:
+            get_brenda()
+        except Exception as exc:  # surfaced again by the next tool call
+            _log(f"background load failed: {exc}")
+        finally:
+            global _loading
+            _loading = None
+
+    # Published before the thread starts, so database_info reports progress
+    # (instead of waiting for the load) from now on.
+    if _brenda is None:
+        _loading = _LoadProgress()
+    thread = threading.Thread(target=load, name="brenda-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+# --------------------------------------------------------------------------- #
+# Result cache                                                                #
+# --------------------------------------------------------------------------- #
+class _ResultCache:
+    """
+    Least-recently-used cache of tool results, holding at most ``max_size``
+    of them, each for at most ``ttl`` seconds (``None``: until evicted). It
+    belongs to one loaded database: looking up results of another one (after
+    a reload) empties it first. ``clock`` returns the current time in seconds.
+    """
+
+    def __init__(
+        self, max_size: int, ttl: Optional[float] = None, clock=time.monotonic
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.brenda: Optional[BRENDA] = None
+        self._results: OrderedDict = OrderedDict()  # key -> (expires, result)
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get(self, brenda: BRENDA, key) -> tuple[bool, Any]:
+        with self._lock:
+            if brenda is not self.brenda:
+                self._results.clear()
+                self.brenda = brenda
+            found = self._results.get(key)
+            if found is not None and (found[0] is None or found[0] > self.clock()):
+                self._results.move_to_end(key)
+                self.hits += 1
+                return True, found[1]
+            if found is not None:
+                del self._results[key]
+                self.expirations += 1
+            self.misses += 1
+            return False, None
+
+    def put(self, brenda: BRENDA, key, result) -> None:
+        if self.max_size <= 0:
+            return
+        expires = None if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            if brenda is not self.brenda:
+                return
+            self._results[key] = (expires, result)
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "release": self.brenda.release if self.brenda is not None else None,
+                "size": len(self._results),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+_results = _ResultCache(
+    int(os.environ.get(CACHE_SIZE_ENV, "256")),
+    float(os.environ[CACHE_TTL_ENV]) if os.environ.get(CACHE_TTL_ENV) else None,
+)
+
+
+def cached(func):
+    """
+    Memoise ``func`` in the shared result cache. Calls are keyed on the
+    function, the loaded release and the arguments bound to its signature
+    (defaults filled in, so ``f(x)``, ``f(x, limit=25)`` and ``f(limit=25,
+    x=x)`` share a result). Results are shared between callers and must not be
+    modified; calls that raise are not cached.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        brenda = get_brenda()
+        key = (func.__qualname__, brenda.release, tuple(bound.arguments.items()))
+        try:
+            found, result = _results.get(brenda, key)
+        except TypeError:  # unhashable argument
+            return func(*args, **kwargs)
+        if not found:
+            result = func(*args, **kwargs)
+            _results.put(brenda, key, result)
+        return result
+
+    return wrapper
+
+
+def cache_stats() -> dict[str, Any]:
+    """Size, limits and hit/miss counters of the result cache."""
+    return _results.stats()
+
+
 # --------------------------------------------------------------------------- #
 # Statistics helpers                                                          #
 # --------------------------------------------------------------------------- #
-def _percentile(sorted_vals: list[float], pct: float) -> float:
-    """Linear-interpolated percentile of an already-sorted list."""
-    if not sorted_vals:
-        return float("nan")
-    if len(sorted_vals) == 1:
-        return sorted_vals[0]
-    rank = (pct / 100) * (len(sorted_vals) - 1)
-    lo = math.floor(rank)
-    hi = math.ceil(rank)
-    if lo == hi:
-        return sorted_vals[lo]
-    frac = rank - lo
-    return sorted_vals[lo] * (1 - frac) + sorted_vals[hi] * frac
-
-
-def _histogram(sorted_vals: list[float], bins: int) -> list[dict[str, float]]:
-    lo, hi = sorted_vals[0], sorted_vals[-1]
-    width = (hi - lo) / bins
-    edges = [lo + i * width for i in range(bins + 1)]
-    counts = [0] * bins
-    for v in sorted_vals:
-        idx = int((v - lo) / width) if width else 0
-        if idx >= bins:  # the maximum value lands in the last bin
-            idx = bins - 1
-        counts[idx] += 1
+def _histogram(values: np.ndarray, bins: int) -> list[dict[str, float]]:
+    # Equal-width bins over [min, max]; the maximum value lands in the last bin.
+    counts, edges = np.histogram(values, bins=bins)
+    edges = edges.tolist()
     return [
-        {"min": round(edges[i], 4), "max": round(edges[i + 1], 4), "count": counts[i]}
-        for i in range(bins)
+        {"min": round(edges[i], 4), "max": round(edges[i + 1], 4), "count": count}
+        for i, count in enumerate(counts.tolist())
     ]
 
 
@@ -152,6 +359,18 @@ def _coerce(
     return out
 
 
+def _clean(
+    values: np.ndarray, *, max_value: Optional[float], drop_negative: bool
+) -> np.ndarray:
+    """Array counterpart of :func:`_coerce` (NaN marks unparseable values)."""
+    keep = np.isfinite(values)
+    if drop_negative:
+        keep &= values >= 0
+    if max_value is not None:
+        keep &= values <= max_value
+    return values[keep]
+
+
 def summarize_values(
     values: Iterable[Any],
     *,
@@ -159,22 +378,35 @@ def summarize_values(
     max_value: Optional[float] = None,
     drop_negative: bool = True,
 ) -> dict[str, Any]:
-    """Reduce a sequence of numbers to a compact summary (count + descriptive
-    stats + optional histogram). Returns ``{"count": 0}`` when nothing parses."""
-    clean = sorted(_coerce(values, max_value=max_value, drop_negative=drop_negative))
+    """Reduce a sequence (or NumPy array) of numbers to a compact summary
+    (count + descriptive stats + optional histogram). Returns ``{"count": 0}``
+    when nothing parses."""
+    if isinstance(values, np.ndarray):
+        clean = _clean(
+            values.astype(np.float64, copy=False),
+            max_value=max_value,
+            drop_negative=drop_negative,
+        )
+    else:
+        clean = np.asarray(
+            _coerce(values, max_value=max_value, drop_negative=drop_negative),
+            dtype=np.float64,
+        )
     n = len(clean)
     if n == 0:
         return {"count": 0}
+    lo, hi = float(clean.min()), float(clean.max())
+    p25, median, p75 = np.percentile(clean, [25, 50, 75]).tolist()
     stats: dict[str, Any] = {
         "count": n,
-        "min": round(clean[0], 6),
-        "max": round(clean[-1], 6),
-        "mean": round(statistics.fmean(clean), 6),
-        "median": round(statistics.median(clean), 6),
-        "p25": round(_percentile(clean, 25), 6),
-        "p75": round(_percentile(clean, 75), 6),
+        "min": round(lo, 6),
+        "max": round(hi, 6),
+        "mean": round(float(clean.mean()), 6),
+        "median": round(median, 6),
+        "p25": round(p25, 6),
+        "p75": round(p75, 6),
     }
-    if bins and n >= 2 and clean[-1] > clean[0]:
+    if bins and n >= 2 and hi > lo:
         stats["histogram"] = _histogram(clean, bins)
     return stats
 
@@ -427,21 +659,145 @@ def enzyme_references(r, *, limit: int = 25) -> dict[str, Any]:
 # --------------------------------------------------------------------------- #
 # Database-level searches and distributions                                   #
 # --------------------------------------------------------------------------- #
-def search_enzymes(query: str, *, limit: int = 25) -> dict[str, Any]:
-    """Substring search over EC number, recommended name and synonyms."""
-    q = query.lower().strip()
-    hits = []
-    for r in get_brenda().reactions:
-        name = r.name or ""
-        if (
-            q in r.ec_number.lower()
-            or q in name.lower()
-            or any(q in (s or "").lower() for s in r.synonyms)
-        ):
-            hits.append({"ec_number": r.ec_number, "name": name})
-            if len(hits) >= limit:
+# Fields searched by search_enzymes, and the kinds of match it ranks, both in
+# order of preference.
+_SEARCH_FIELDS = ("ec_number", "name", "systematic_name", "synonym")
+_MATCH_KINDS = ("exact", "prefix", "substring")
+
+
+class _SearchIndex:
+    """
+    Inverted index of the EC numbers, recommended names, systematic names and
+    synonyms of one loaded database. Every distinct lowercased text is a term,
+    listing the ``(position, field)`` it names in CSR arrays; ``grams`` maps
+    each three-character substring to the sorted ids of the terms containing
+    it, so a query only compares itself with the terms holding all of its
+    trigrams (queries shorter than that check every term).
+    """
+
+    def __init__(self, brenda: BRENDA):
+        self.brenda = brenda
+        self.ec_numbers: list[str] = []
+        self.names: list[str] = []
+        term_ids: dict[str, int] = {}
+        owners: list[list[tuple[int, int]]] = []
+        for position, r in enumerate(brenda.reactions):
+            self.ec_numbers.append(r.ec_number)
+            self.names.append(r.name or "")
+            texts = [r.ec_number, r.name, r.systematic_name]
+            for field, text in enumerate(texts + list(r.synonyms)):
+                term = (text or "").lower().strip()
+                if not term:
+                    continue
+                term_id = term_ids.setdefault(term, len(owners))
+                if term_id == len(owners):
+                    owners.append([])
+                owners[term_id].append((position, min(field, 3)))
+        self.terms = list(term_ids)
+        self.owner_ptr = np.cumsum([0] + [len(pairs) for pairs in owners])
+        flat = [pair for pairs in owners for pair in pairs]
+        self.owner_position = np.array([p for p, _ in flat], dtype=np.int64)
+        self.owner_field = np.array([f for _, f in flat], dtype=np.int8)
+        grams: dict[str, list[int]] = {}
+        for term_id, term in enumerate(self.terms):
+            for gram in {term[i : i + 3] for i in range(len(term) - 2)}:
+                grams.setdefault(gram, []).append(term_id)
+        self.grams = {
+            gram: np.array(ids, dtype=np.int64) for gram, ids in grams.items()
+        }
+
+    def _candidates(self, query: str) -> Iterable[int]:
+        if len(query) < 3:
+            return range(len(self.terms))
+        postings = sorted(
+            (self.grams.get(query[i : i + 3], ()) for i in range(len(query) - 2)),
+            key=len,
+        )
+        candidates = np.asarray(postings[0], dtype=np.int64)
+        for ids in postings[1:]:
+            if not len(candidates):
                 break
-    return {"query": query, "count": len(hits), "results": hits}
+            candidates = np.intersect1d(candidates, ids, assume_unique=True)
+        return candidates.tolist()
+
+    def search(self, query: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Positions of the enzymes matching ``query``, with the kind of their
+        best match (index into ``_MATCH_KINDS``) and the field it is in
+        (index into ``_SEARCH_FIELDS``), best matches first, then by field,
+        then in database order.
+        """
+        q = query.lower().strip()
+        matched, kinds = [], []
+        for term_id in self._candidates(q):
+            term = self.terms[term_id]
+            if term == q:
+                kind = 0
+            elif term.startswith(q):
+                kind = 1
+            elif q in term:
+                kind = 2
+            else:
+                continue
+            matched.append(term_id)
+            kinds.append(kind)
+        term_ids = np.array(matched, dtype=np.int64)
+        starts = self.owner_ptr[term_ids]
+        counts = self.owner_ptr[term_ids + 1] - starts
+        rows = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(
+            counts.sum()
+        )
+        positions = self.owner_position[rows]
+        fields = self.owner_field[rows]
+        kinds = np.repeat(np.array(kinds, dtype=np.int8), counts)
+        # Keep the best (kind, field) of every enzyme, then rank the enzymes.
+        order = np.lexsort((fields, kinds, positions))
+        positions, kinds, fields = positions[order], kinds[order], fields[order]
+        first = np.flatnonzero(np.diff(positions, prepend=-1))
+        positions, kinds, fields = positions[first], kinds[first], fields[first]
+        order = np.lexsort((positions, fields, kinds))
+        return positions[order], kinds[order], fields[order]
+
+
+def _search_index(brenda: BRENDA) -> _SearchIndex:
+    """The :class:`_SearchIndex` of ``brenda``, built on first use (for the
+    shared database, as part of loading it)."""
+    global _search_indexes
+    with _search_indexes_lock:
+        if _search_indexes is None or _search_indexes.brenda is not brenda:
+            _log("building search index ...")
+            _search_indexes = _SearchIndex(brenda)
+        return _search_indexes
+
+
+def search_enzymes(query: str, *, limit: int = 25, offset: int = 0) -> dict[str, Any]:
+    """Search EC numbers, recommended names, systematic names and synonyms.
+    Enzymes are ranked by their best match — exact, then prefix, then
+    substring — and, among equal matches, by field then database order, so
+    ``offset`` pages through a stable ordering."""
+    if limit < 0 or offset < 0:
+        raise ValueError("limit and offset must not be negative")
+    index = _search_index(get_brenda())
+    positions, kinds, fields = index.search(query)
+    page = slice(offset, offset + limit)
+    results = [
+        {
+            "ec_number": index.ec_numbers[position],
+            "name": index.names[position],
+            "match": _MATCH_KINDS[kind],
+            "field": _SEARCH_FIELDS[field],
+        }
+        for position, kind, field in zip(
+            positions[page].tolist(), kinds[page].tolist(), fields[page].tolist()
+        )
+    ]
+    return {
+        "query": query,
+        "total": len(positions),
+        "offset": offset,
+        "count": len(results),
+        "results": results,
+    }
 
 
 def find_enzymes_by_compound(
@@ -477,6 +833,67 @@ def find_enzymes_by_organism(organism: str, *, limit: int = 25) -> dict[str, Any
     }
 
 
+class _ParameterTable:
+    """
+    The values of every :func:`parameter_distribution` parameter across one
+    loaded database, as a :class:`brendapyrser.ValueTable` (one row per record:
+    value, enzyme, compound and organism codes). Built once per database, it
+    turns the organism and compound filters into array masks.
+    """
+
+    def __init__(self, brenda: BRENDA):
+        self.brenda = brenda
+        self.table = brenda.value_table(list(_DISTRIBUTION_FIELD.values()))
+        self.compounds_lower = [c.lower() for c in self.table.compounds]
+        self.rows = {
+            parameter: np.flatnonzero(self.table.field_mask(field))
+            for parameter, field in _DISTRIBUTION_FIELD.items()
+        }
+
+    def values(
+        self, parameter: str, *, organism: Optional[str], compound: Optional[str]
+    ) -> np.ndarray:
+        """Values of ``parameter`` (NaN where unparseable) after the filters
+        applied by :func:`_collect_property_values` for each enzyme."""
+        table = self.table
+        rows = self.rows[parameter]
+        if compound is not None and parameter in _KINETIC_PROPERTY:
+            rows = rows[self._compound_rows(rows, compound)]
+        if organism:
+            rows = rows[table.organism_mask(organism)[rows]]
+        return table.value[rows]
+
+    def _compound_rows(self, rows: np.ndarray, compound: str) -> np.ndarray:
+        """Mask of ``rows`` matching ``compound`` the way
+        :func:`_match_compound_keys` resolves it within each enzyme: exact
+        matches if the enzyme has any, else case-insensitive ones, else
+        substring ones."""
+        table = self.table
+        low = compound.lower()
+        codes = table.compound[rows]
+        ecs = table.ec[rows]
+        exact = table.compound_mask(compound)[rows]
+        ci = np.isin(codes, [i for i, c in enumerate(self.compounds_lower) if c == low])
+        sub = np.isin(
+            codes, [i for i, c in enumerate(self.compounds_lower) if low in c]
+        )
+        n_enzymes = len(table.ec_numbers)
+        use_exact = (np.bincount(ecs[exact], minlength=n_enzymes) > 0)[ecs]
+        use_ci = ~use_exact & (np.bincount(ecs[ci], minlength=n_enzymes) > 0)[ecs]
+        use_sub = ~use_exact & ~use_ci
+        return (use_exact & exact) | (use_ci & ci) | (use_sub & sub)
+
+
+def _parameter_table(brenda: BRENDA) -> _ParameterTable:
+    """The :class:`_ParameterTable` of ``brenda``, built on first use."""
+    global _parameter_tables
+    with _parameter_tables_lock:
+        if _parameter_tables is None or _parameter_tables.brenda is not brenda:
+            _log("building parameter value tables ...")
+            _parameter_tables = _ParameterTable(brenda)
+        return _parameter_tables
+
+
 def parameter_distribution(
     parameter: str,
     *,
@@ -488,37 +905,20 @@ def parameter_distribution(
     """Aggregate one kinetic/condition parameter across the whole database (or a
     genus/species subset), returning summary statistics + a histogram. This is
     the tool behind questions like "median KM in BRENDA" or "median optimal
-    temperature in the genus Thermotoga"."""
+    temperature in the genus Thermotoga". The first call builds the value table
+    of every parameter (see :class:`_ParameterTable`); later calls only mask
+    and summarise arrays."""
+    if parameter not in _DISTRIBUTION_FIELD:
+        raise ValueError(
+            "parameter must be one of: km, kcat, ki, kcat_km, "
+            "specific_activity, temperature_optimum, ph_optimum"
+        )
     brenda = get_brenda()
-    reactions = (
-        brenda.reactions.filter_by_organism(organism) if organism else brenda.reactions
+    values = _parameter_table(brenda).values(
+        parameter, organism=organism, compound=compound
     )
-
-    values: list[Any] = []
-    n_scanned = 0
-    for r in reactions:
-        n_scanned += 1
-        if parameter in _KINETIC_PROPERTY:
-            prop = getattr(r, _KINETIC_PROPERTY[parameter])
-            vals, _ = _collect_property_values(
-                prop, compound=compound, organism=organism
-            )
-            values.extend(vals)
-        elif parameter == "specific_activity":
-            for rec in r.specificActivities:
-                if not organism or _organism_matches(organism, rec.get("species", [])):
-                    values.append(rec.get("value"))
-        elif parameter in ("temperature_optimum", "ph_optimum"):
-            prop_name, condition = parameter.split("_", 1)
-            source = r.temperature if prop_name == "temperature" else r.PH
-            for rec in source.get(condition, []):
-                if not organism or _organism_matches(organism, rec.get("species", [])):
-                    values.append(rec.get("value"))
-        else:
-            raise ValueError(
-                "parameter must be one of: km, kcat, ki, kcat_km, "
-                "specific_activity, temperature_optimum, ph_optimum"
-            )
+    reactions = brenda.reactions
+    n_scanned = len(reactions.filter_by_organism(organism) if organism else reactions)
 
     return {
         "parameter": parameter,
@@ -532,8 +932,14 @@ def parameter_distribution(
 
 
 def database_info() -> dict[str, Any]:
+    """Release information, or the load progress while the database is being
+    loaded in the background (instead of waiting for it)."""
+    loading = _loading
+    if _brenda is None and loading is not None:
+        return {"status": "loading", **loading.report()}
     brenda = get_brenda()
     return {
+        "status": "ready",
         "release": brenda.release,
         "schema_version": brenda.schema_version,
         "n_enzymes": len(brenda.reactions),
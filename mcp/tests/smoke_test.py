@@ -70,7 +70,7 @@ async def main() -> None:
             print(
                 f"Server exposes {len(tools)} tools: {', '.join(t.name for t in tools)}\n"
             )
-            check("expected tool count", len(tools) == 11, f"got {len(tools)}")
+            check("expected tool count", len(tools) == 12, f"got {len(tools)}")
 
             info = await call(session, "get_database_info")
             check("database release", info["release"] == "2026.1", info["release"])
@@ -80,6 +80,20 @@ async def main() -> None:
             ecs = {h["ec_number"] for h in found["results"]}
             check("search finds 1.1.1.304", "1.1.1.304" in ecs, str(ecs))
 
+            exact = await call(session, "search_enzymes", query="budC")
+            check(
+                "search ranks an exact synonym match",
+                exact["results"][0]["match"] == "exact"
+                and exact["results"][0]["field"] == "synonym",
+                str(exact["results"][:1]),
+            )
+            page = await call(session, "search_enzymes", query="", limit=1, offset=1)
+            check(
+                "search pages through all matches",
+                page["total"] == 2 and page["results"][0]["ec_number"] == "6.6.99.99",
+                str(page),
+            )
+
             ov = await call(session, "get_enzyme", ec_number="1.1.1.304")
             check("overview name", "reductase" in ov["name"].lower(), ov["name"])
             check(
@@ -178,6 +192,33 @@ async def main() -> None:
                 str(dist["enzymes_scanned"]),
             )
 
+            km_dist = await call(
+                session,
+                "compute_parameter_distribution",
+                parameter="km",
+                compound="nadh",
+            )
+            check(
+                "km distribution for NADH matches the enzyme's NADH values",
+                km_dist["stats"]["count"] == km_nadh["stats"]["count"],
+                f"{km_dist['stats'].get('count')} vs {km_nadh['stats']['count']}",
+            )
+
+            before = await call(session, "get_cache_stats")
+            again = await call(
+                session,
+                "compute_parameter_distribution",
+                parameter="km",
+                compound="nadh",
+                bins=10,
+            )
+            after = await call(session, "get_cache_stats")
+            check(
+                "repeated call is answered from the result cache",
+                again == km_dist and after["hits"] == before["hits"] + 1,
+                f"hits {before['hits']} -> {after['hits']}",
+            )
+
     print("\nAll smoke-test checks passed.")
 
 
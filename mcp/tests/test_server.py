@@ -0,0 +1,101 @@
+"""
+Concurrency limits of the MCP tool wrapper (``server._offloaded``), including
+calls abandoned on timeout whose worker threads are still running.
+
+    python -m pytest tests/test_server.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from brenda_mcp import server  # noqa: E402
+
+
+class _Probe:
+    """A blocking call that records how many of its runs overlap."""
+
+    def __init__(self, seconds: float):
+        self.__name__ = "probe"
+        self.seconds = seconds
+        self.lock = threading.Lock()
+        self.running = self.peak = self.finished = 0
+
+    def __call__(self) -> str:
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.seconds)
+        with self.lock:
+            self.running -= 1
+            self.finished += 1
+        return "done"
+
+
+class TestOffloaded(unittest.TestCase):
+    def test_returns_result(self):
+        tool = server._offloaded()(_Probe(0))
+        self.assertEqual(asyncio.run(tool()), "done")
+
+    def test_timeout_raises(self):
+        tool = server._offloaded()(_Probe(0.3))
+        with mock.patch.object(server, "_tool_timeout", 0.05):
+            with self.assertRaises(TimeoutError):
+                asyncio.run(tool())
+
+    def test_timed_out_calls_keep_their_tool_slot(self):
+        probe = _Probe(0.3)
+
+        async def calls():
+            tool = server._offloaded(concurrency=1)(probe)
+            for _ in range(4):
+                with self.assertRaises(TimeoutError):
+                    await tool()
+            # Let the abandoned calls drain before the event loop closes.
+            while probe.finished < 1:
+                await asyncio.sleep(0.05)
+
+        with mock.patch.object(server, "_tool_timeout", 0.05):
+            asyncio.run(calls())
+        self.assertEqual(probe.peak, 1)
+
+    def test_timed_out_calls_keep_their_worker(self):
+        probe = _Probe(1)
+        workers = ThreadPoolExecutor(2)
+        tool = server._offloaded()(probe)
+
+        async def calls():
+            for _ in range(6):
+                with self.assertRaises(TimeoutError):
+                    await tool()
+
+        with mock.patch.object(server, "_workers", workers), mock.patch.object(
+            server, "_tool_timeout", 0.05
+        ):
+            asyncio.run(calls())
+        workers.shutdown(wait=True)
+        self.assertEqual(probe.peak, 2)
+        self.assertEqual(probe.finished, 2)
+
+    def test_concurrent_calls_respect_tool_limit(self):
+        probe = _Probe(0.05)
+        tool = server._offloaded(concurrency=2)(probe)
+
+        async def calls():
+            return await asyncio.gather(*(tool() for _ in range(6)))
+
+        self.assertEqual(asyncio.run(calls()), ["done"] * 6)
+        self.assertEqual(probe.peak, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
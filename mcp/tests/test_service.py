@@ -0,0 +1,191 @@
+"""
+Unit tests of the service layer that need no real database load: background
+warm-up and the result cache.
+
+    python -m pytest tests/test_service.py
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from brenda_mcp import service  # noqa: E402
+
+FIXTURE = (
+    Path(__file__).resolve().parents[2] / "tests" / "fixtures" / "brenda_sample.json"
+)
+
+
+class _SlowBRENDA:
+    """Stands in for BRENDA: reports some progress, then waits to be released."""
+
+    release = "2026.1"
+    schema_version = "1"
+    copyright = "test"
+    reactions = []
+
+    started = threading.Event()
+    finish = threading.Event()
+
+    def __init__(self, path, progress=None):
+        progress(10, 100, 0, None)
+        self.started.set()
+        self.finish.wait(5)
+
+
+class TestBackgroundLoad(unittest.TestCase):
+    def setUp(self):
+        _SlowBRENDA.started.clear()
+        _SlowBRENDA.finish.clear()
+        patches = [
+            mock.patch.object(service, "BRENDA", _SlowBRENDA),
+            mock.patch.object(service, "_brenda", None),
+            mock.patch.object(service, "_loading", None),
+            mock.patch.dict("os.environ", {service.DB_PATH_ENV: str(FIXTURE)}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _info_without_blocking(self) -> dict:
+        result = {}
+        thread = threading.Thread(
+            target=lambda: result.update(service.database_info()), daemon=True
+        )
+        thread.start()
+        thread.join(1)
+        self.assertFalse(thread.is_alive(), "database_info waited for the load")
+        return result
+
+    def test_reports_progress_as_soon_as_started(self):
+        # Keep the loader thread from taking the lock until checked.
+        with service._lock:
+            loader = service.start_background_load()
+            info = self._info_without_blocking()
+        self.assertEqual(info["status"], "loading")
+        self.assertEqual(info["stage"], "starting")
+        _SlowBRENDA.finish.set()
+        loader.join(5)
+
+    def test_reports_progress_mid_load(self):
+        loader = service.start_background_load()
+        self.assertTrue(_SlowBRENDA.started.wait(5))
+        info = self._info_without_blocking()
+        self.assertEqual(info["status"], "loading")
+        self.assertEqual((info["bytes_read"], info["total_bytes"]), (10, 100))
+        _SlowBRENDA.finish.set()
+        loader.join(5)
+        self.assertFalse(loader.is_alive())
+        info = service.database_info()
+        self.assertEqual(info["status"], "ready")
+        self.assertEqual(info["release"], "2026.1")
+        self.assertIsNone(service._loading)
+
+
+class _Database:
+    release = "2026.1"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.db = _Database()
+        self.clock = _Clock()
+
+    def test_lru_eviction_at_max_size(self):
+        cache = service._ResultCache(2, clock=self.clock)
+        for key in "abc":
+            cache.get(self.db, key)
+            cache.put(self.db, key, key.upper())
+        self.assertEqual(cache.get(self.db, "a"), (False, None))
+        self.assertEqual(cache.get(self.db, "b"), (True, "B"))
+        # "b" is now the most recently used, so "c" goes next.
+        cache.put(self.db, "d", "D")
+        self.assertEqual(cache.get(self.db, "c"), (False, None))
+        self.assertEqual(cache.get(self.db, "b"), (True, "B"))
+        stats = cache.stats()
+        self.assertEqual((stats["size"], stats["max_size"]), (2, 2))
+        self.assertEqual(stats["evictions"], 2)
+
+    def test_ttl_expiry(self):
+        cache = service._ResultCache(8, ttl=10, clock=self.clock)
+        cache.get(self.db, "a")
+        cache.put(self.db, "a", 1)
+        self.clock.now = 9.9
+        self.assertEqual(cache.get(self.db, "a"), (True, 1))
+        self.clock.now = 10.0
+        self.assertEqual(cache.get(self.db, "a"), (False, None))
+        stats = cache.stats()
+        self.assertEqual((stats["size"], stats["expirations"]), (0, 1))
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+
+    def test_new_database_empties_cache(self):
+        cache = service._ResultCache(8, clock=self.clock)
+        cache.get(self.db, "a")
+        cache.put(self.db, "a", 1)
+        self.assertEqual(cache.get(_Database(), "a"), (False, None))
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_disabled_cache_stores_nothing(self):
+        cache = service._ResultCache(0, clock=self.clock)
+        cache.get(self.db, "a")
+        cache.put(self.db, "a", 1)
+        self.assertEqual(cache.get(self.db, "a"), (False, None))
+
+    def test_cached_keys_on_bound_arguments(self):
+        calls = []
+
+        @service.cached
+        def lookup(ec_number: str, limit: int = 25, organism=None):
+            calls.append((ec_number, limit, organism))
+            return len(calls)
+
+        cache = service._ResultCache(8, clock=self.clock)
+        with mock.patch.object(service, "_results", cache), mock.patch.object(
+            service, "get_brenda", return_value=self.db
+        ):
+            first = lookup("1.1.1.1")
+            # Same call spelled differently: positional, keyword, default.
+            self.assertEqual(lookup("1.1.1.1", 25), first)
+            self.assertEqual(lookup(limit=25, ec_number="1.1.1.1"), first)
+            # Calls differing in any argument are cached separately.
+            self.assertNotEqual(lookup("1.1.1.2"), first)
+            self.assertNotEqual(lookup("1.1.1.1", limit=5), first)
+            self.assertNotEqual(lookup("1.1.1.1", organism="E. coli"), first)
+            self.assertEqual(lookup("1.1.1.1", organism="E. coli"), 4)
+        self.assertEqual(len(calls), 4)
+        self.assertEqual((cache.stats()["hits"], cache.stats()["misses"]), (3, 4))
+
+    def test_failures_are_not_cached(self):
+        calls = []
+
+        @service.cached
+        def failing(ec_number: str):
+            calls.append(ec_number)
+            raise ValueError(ec_number)
+
+        cache = service._ResultCache(8, clock=self.clock)
+        with mock.patch.object(service, "_results", cache), mock.patch.object(
+            service, "get_brenda", return_value=self.db
+        ):
+            for _ in range(2):
+                with self.assertRaises(ValueError):
+                    failing("9.9.9.9")
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+from .columnar import ValueTable
 from .parser import BRENDA, Reaction, ReactionList
 
-__all__ = ["BRENDA", "Reaction", "ReactionList"]
+__all__ = ["BRENDA", "Reaction", "ReactionList", "ValueTable"]
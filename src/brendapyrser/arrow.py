@@ -0,0 +1,351 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Apache Arrow / Parquet copy of the BRENDA database (requires ``pyarrow``).
+
+The database is flattened into one table per record field of
+``constants.DATA_FIELDS`` plus ``enzymes``, ``proteins`` and ``references``.
+Every row carries its ``ec_number`` and ``ec_class`` (the first EC digit);
+record rows keep BRENDA's protein and reference ids and add the resolved
+``organisms`` and the PubMed ids (``pmids``) of the cited references.
+
+On disk a dataset is a directory with a ``_brenda.json`` manifest and one
+sub-directory per table, Hive-partitioned by EC class::
+
+    <directory>/_brenda.json
+    <directory>/km_value/ec_class=1/part-0.parquet
+    <directory>/km_value/ec_class=2/part-0.parquet
+    ...
+
+Such a dataset holds every key of the raw entries, so :class:`_Dataset` can
+rebuild them and serve as an alternative to the JSON. Files are written in row
+groups of ``ROW_GROUP_SIZE`` rows, the unit in which entries are read back.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import defaultdict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = pc = pq = None
+
+import numpy as np
+
+from .constants import DATA_FIELDS
+
+FORMAT = 1
+MANIFEST = "_brenda.json"
+ROW_GROUP_SIZE = 2048
+
+# (column, key in the raw BRENDA record or None if derived, type)
+_ENZYME_COLUMNS = [
+    ("ec_number", "id", "str"),
+    ("recommended_name", "recommended_name", "str"),
+    ("systematic_name", "systematic_name", "str"),
+    ("history", "history", "str"),
+]
+_RECORD_COLUMNS = [
+    ("value", "value", "str"),
+    ("comment", "comment", "str"),
+    ("protein_ids", "proteins", "strs"),
+    ("reference_ids", "references", "strs"),
+    ("organisms", None, "strs"),
+    ("pmids", None, "ints"),
+]
+_PROTEIN_COLUMNS = [
+    ("protein_id", "id", "str"),
+    ("organism", "organism", "str"),
+    ("accessions", "accessions", "strs"),
+    ("source", "source", "str"),
+    ("comment", "comment", "str"),
+    ("reference_ids", "references", "strs"),
+]
+_REFERENCE_COLUMNS = [
+    ("reference_id", "id", "str"),
+    ("title", "title", "str"),
+    ("authors", "authors", "strs"),
+    ("journal", "journal", "str"),
+    ("year", "year", "int"),
+    ("vol", "vol", "str"),
+    ("pages", "pages", "str"),
+    ("pmid", "pmid", "int"),
+]
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for Arrow/Parquet support: "
+            "pip install 'brendapyrser[arrow]'"
+        )
+
+
+def _schema(columns: list):
+    types = {
+        "str": pa.string(),
+        "strs": pa.list_(pa.string()),
+        "int": pa.int64(),
+        "ints": pa.list_(pa.int64()),
+    }
+    return pa.schema(
+        [("ec_class", pa.string())]
+        + ([] if columns is _ENZYME_COLUMNS else [("ec_number", pa.string())])
+        + [(name, types[kind]) for name, _, kind in columns]
+    )
+
+
+def _layout() -> dict:
+    """Column layout of every table, as ``{table: [(column, key, type)]}``."""
+    tables = {
+        "enzymes": _ENZYME_COLUMNS,
+        "proteins": _PROTEIN_COLUMNS,
+        "references": _REFERENCE_COLUMNS,
+    }
+    tables.update((field, _RECORD_COLUMNS) for field in DATA_FIELDS)
+    return tables
+
+
+def build_tables(reactions) -> dict:
+    """Flatten ``reactions`` into ``{table_name: pyarrow.Table}``."""
+    _require_pyarrow()
+    layout = _layout()
+    rows = {name: [] for name in layout}
+    for rxn in reactions:
+        entry = rxn._entry()
+        ec_number = entry.get("id", rxn.ec_number)
+        ec_class = ec_number.split(".", 1)[0]
+        proteins = entry.get("protein", {})
+        references = entry.get("reference", {})
+
+        enzyme = _row(entry, _ENZYME_COLUMNS, ec_class)
+        enzyme["ec_number"] = ec_number
+        if not isinstance(enzyme["history"], str):
+            enzyme["history"] = None
+        rows["enzymes"].append(enzyme)
+        for protein in proteins.values():
+            rows["proteins"].append(
+                _row(protein, _PROTEIN_COLUMNS, ec_class, ec_number)
+            )
+        for reference in references.values():
+            rows["references"].append(
+                _row(reference, _REFERENCE_COLUMNS, ec_class, ec_number)
+            )
+        for field in DATA_FIELDS:
+            records = entry.get(field)
+            if not isinstance(records, list):
+                continue
+            for record in records:
+                if not isinstance(record, Mapping):
+                    continue
+                row = _row(record, _RECORD_COLUMNS, ec_class, ec_number)
+                row["organisms"] = list(
+                    dict.fromkeys(
+                        proteins[pid]["organism"]
+                        for pid in record.get("proteins", [])
+                        if pid in proteins
+                    )
+                )
+                row["pmids"] = [
+                    references[rid]["pmid"]
+                    for rid in record.get("references", [])
+                    if references.get(rid, {}).get("pmid")
+                ]
+                rows[field].append(row)
+    return {
+        name: pa.Table.from_pylist(rows[name], schema=_schema(columns))
+        for name, columns in layout.items()
+    }
+
+
+def _record(row: dict, columns: list) -> dict:
+    """Inverse of :func:`_row`: the raw BRENDA record stored in ``row``."""
+    return {
+        key: row[name]
+        for name, key, _ in columns
+        if key is not None and row.get(name) is not None
+    }
+
+
+def _row(raw: dict, columns: list, ec_class: str, ec_number: str = None) -> dict:
+    row = {"ec_class": ec_class}
+    if ec_number is not None:
+        row["ec_number"] = ec_number
+    for name, key, _ in columns:
+        if key is not None:
+            row[name] = raw.get(key)
+    return row
+
+
+def write_dataset(
+    tables: dict, directory, header: dict, version: str, max_workers=None
+) -> Path:
+    """
+    Write ``tables`` under ``directory`` in the layout described above, one
+    Parquet file per table and EC class, using a pool of ``max_workers``
+    threads (pyarrow releases the GIL while encoding and compressing).
+    """
+    _require_pyarrow()
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    jobs = []
+    for name, table in tables.items():
+        classes = pc.unique(table["ec_class"]).to_pylist()
+        if not classes:
+            jobs.append((table.remove_column(0), directory / name))
+        for ec_class in sorted(classes):
+            part = table.filter(pc.equal(table["ec_class"], ec_class))
+            jobs.append(
+                (
+                    part.remove_column(0),
+                    directory / name / f"ec_class={ec_class}",
+                )
+            )
+
+    def write(job):
+        table, path = job
+        path.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, path / "part-0.parquet", row_group_size=ROW_GROUP_SIZE)
+
+    with ThreadPoolExecutor(max_workers) as pool:
+        list(pool.map(write, jobs))
+
+    manifest = {
+        "format": FORMAT,
+        "brendapyrser": version,
+        "release": header.get("release", ""),
+        "version": header.get("version", ""),
+        "tables": list(tables),
+    }
+    (directory / MANIFEST).write_text(json.dumps(manifest, indent=2))
+    return directory
+
+
+class _Dataset:
+    """
+    A Parquet dataset written by :func:`write_dataset`. Opening it decodes only
+    the ``ec_number`` column of every file, to locate the rows of every EC
+    number; :meth:`load` rebuilds the raw BRENDA entry of one EC number by
+    decoding the row groups holding its rows. The last row group decoded of
+    each table is kept, so entries read in database order decode every row
+    group once.
+    """
+
+    def __init__(self, directory):
+        _require_pyarrow()
+        self.directory = Path(directory)
+        manifest_path = self.directory / MANIFEST
+        if not manifest_path.is_file():
+            raise ValueError(f"{self.directory} is not a BRENDA Parquet dataset")
+        manifest = json.loads(manifest_path.read_text())
+        if manifest.get("format") != FORMAT:
+            raise ValueError(
+                f"Unsupported BRENDA Parquet dataset format: {manifest.get('format')}"
+            )
+        self.header = {
+            "release": manifest.get("release", ""),
+            "version": manifest.get("version", ""),
+        }
+        layout = _layout()
+        self.files = {}  # table -> [(ParquetFile, first row of each row group)]
+        self.spans = {}  # table -> {ec_number: [(file, start, length), ...]}
+        for name in manifest["tables"]:
+            if name not in layout:
+                continue
+            self.files[name] = []
+            spans = defaultdict(list)
+            for position, path in enumerate(
+                sorted((self.directory / name).rglob("*.parquet"))
+            ):
+                parquet = pq.ParquetFile(path, memory_map=True)
+                metadata = parquet.metadata
+                sizes = [
+                    metadata.row_group(i).num_rows
+                    for i in range(metadata.num_row_groups)
+                ]
+                self.files[name].append((parquet, np.cumsum([0] + sizes)))
+                column = parquet.read(columns=["ec_number"])
+                for ec_number, runs in _spans(column).items():
+                    spans[ec_number].extend(
+                        (position, start, length) for start, length in runs
+                    )
+            self.spans[name] = dict(spans)
+        self.__decoded = {}  # table -> ((file, row group), pyarrow.Table)
+        self.__lock = threading.Lock()
+
+    def __iter__(self):
+        return iter(self.spans["enzymes"])
+
+    def __len__(self):
+        return len(self.spans["enzymes"])
+
+    def __row_group(self, name: str, position: int, group: int):
+        with self.__lock:
+            key, table = self.__decoded.get(name, (None, None))
+            if key != (position, group):
+                parquet, _ = self.files[name][position]
+                table = parquet.read_row_group(group)
+                self.__decoded[name] = ((position, group), table)
+            return table
+
+    def __rows(self, name: str, ec_number: str) -> list:
+        rows = []
+        for position, start, length in self.spans.get(name, {}).get(ec_number, []):
+            _, firsts = self.files[name][position]
+            group = int(np.searchsorted(firsts, start, side="right")) - 1
+            while length > 0:
+                table = self.__row_group(name, position, group)
+                offset = start - int(firsts[group])
+                part = table.slice(offset, length)
+                rows.extend(part.to_pylist())
+                start += len(part)
+                length -= len(part)
+                group += 1
+        return rows
+
+    def load(self, ec_number: str) -> dict:
+        """Raw BRENDA entry of ``ec_number``, as in the JSON document."""
+        entry = {}
+        for row in self.__rows("enzymes", ec_number):
+            entry.update(_record(row, _ENZYME_COLUMNS))
+        entry["id"] = ec_number
+        proteins = self.__rows("proteins", ec_number)
+        if proteins:
+            entry["protein"] = {
+                row["protein_id"]: _record(row, _PROTEIN_COLUMNS) for row in proteins
+            }
+        references = self.__rows("references", ec_number)
+        if references:
+            entry["reference"] = {
+                row["reference_id"]: _record(row, _REFERENCE_COLUMNS)
+                for row in references
+            }
+        for field in DATA_FIELDS:
+            records = self.__rows(field, ec_number)
+            if records:
+                entry[field] = [_record(row, _RECORD_COLUMNS) for row in records]
+        return entry
+
+
+def _spans(table) -> dict:
+    """``{ec_number: [(start, length), ...]}`` runs of rows in ``table``."""
+    column = table.column("ec_number")
+    if len(column) == 0:
+        return {}
+    encoded = column.combine_chunks().dictionary_encode()
+    codes = encoded.indices.to_numpy(zero_copy_only=False)
+    names = encoded.dictionary.to_pylist()
+    bounds = np.concatenate(([0], np.flatnonzero(np.diff(codes)) + 1, [len(codes)]))
+    spans = defaultdict(list)
+    for start, stop in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+        spans[names[codes[start]]].append((start, stop - start))
+    return dict(spans)
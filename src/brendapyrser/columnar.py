@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Columnar (NumPy) view of BRENDA's numeric value records.
+
+:class:`ValueTable` flattens the records of one or more numeric fields of every
+reaction (by default ``constants.KINETIC_FIELDS``) into parallel arrays, one row
+per record, so that database-wide analyses become vectorised masks instead of
+walks over nested dicts of lists of dicts. Repeated strings (fields, EC numbers,
+compounds, organisms, reference ids) are integer-coded against vocabularies;
+the variable number of organisms and references per record is stored as
+offset (CSR) arrays.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .constants import KINETIC_FIELDS
+from .values import parse_values
+
+
+class _Vocabulary:
+    """Assigns consecutive integer codes to strings in order of appearance."""
+
+    def __init__(self):
+        self.codes = {}
+        self.terms = []
+
+    def encode(self, term: str) -> int:
+        code = self.codes.get(term)
+        if code is None:
+            code = self.codes[term] = len(self.terms)
+            self.terms.append(term)
+        return code
+
+
+class ValueTable:
+    """
+    Columnar table of numeric BRENDA records.
+
+    Row ``i`` describes one record: ``fields[field[i]]`` is its BRENDA field,
+    ``ec_numbers[ec[i]]`` its enzyme and ``compounds[compound[i]]`` the
+    ``{...}`` compound of kinetic values (``""`` when absent). ``value`` holds
+    the point value (the mean of ``a-b`` ranges) and ``low``/``high`` the range
+    bounds; unparseable numbers are ``NaN``. The organisms of row ``i`` are
+    ``organism_codes[organism_offsets[i]:organism_offsets[i + 1]]`` (codes into
+    ``organisms``) and its BRENDA reference ids are, likewise, the slice of
+    ``reference_codes`` delimited by ``reference_offsets`` (codes into
+    ``references``; reference ids are only unique within an EC number).
+    """
+
+    def __init__(
+        self,
+        fields: list,
+        ec_numbers: list,
+        compounds: list,
+        organisms: list,
+        references: list,
+        columns: dict,
+    ):
+        self.fields = fields
+        self.ec_numbers = ec_numbers
+        self.compounds = compounds
+        self.organisms = organisms
+        self.references = references
+        self._compound_codes = {c: i for i, c in enumerate(compounds)}
+        self.field = columns["field"]
+        self.ec = columns["ec"]
+        self.compound = columns["compound"]
+        self.value = columns["value"]
+        self.low = columns["low"]
+        self.high = columns["high"]
+        self.organism_offsets = columns["organism_offsets"]
+        self.organism_codes = columns["organism_codes"]
+        self.reference_offsets = columns["reference_offsets"]
+        self.reference_codes = columns["reference_codes"]
+        # Built on first use by organism_mask / rows_with_organisms.
+        self._organisms_lower = None
+        self._organism_rows = None
+
+    @classmethod
+    def from_reactions(cls, reactions, fields=None) -> ValueTable:
+        """Build the table from the records of ``fields`` of all ``reactions``."""
+        fields = list(KINETIC_FIELDS if fields is None else fields)
+        ec_numbers, compounds = _Vocabulary(), _Vocabulary()
+        organisms, references = _Vocabulary(), _Vocabulary()
+        field_col, ec_col, compound_col = [], [], []
+        number_col = []
+        organism_counts, organism_codes = [], []
+        reference_counts, reference_codes = [], []
+        for rxn in reactions:
+            ec_code = ec_numbers.encode(rxn.ec_number)
+            for field_code, field in enumerate(fields):
+                for compound, number, orgs, refs in rxn._numeric_records(field):
+                    field_col.append(field_code)
+                    ec_col.append(ec_code)
+                    compound_col.append(compounds.encode(compound))
+                    number_col.append(number)
+                    organism_counts.append(len(orgs))
+                    organism_codes.extend(organisms.encode(o) for o in orgs)
+                    reference_counts.append(len(refs))
+                    reference_codes.extend(references.encode(r) for r in refs)
+
+        parsed = parse_values(number_col)
+        columns = {
+            "field": np.asarray(field_col, dtype=np.int8),
+            "ec": np.asarray(ec_col, dtype=np.int32),
+            "compound": np.asarray(compound_col, dtype=np.int32),
+            "organism_offsets": _offsets(organism_counts),
+            "organism_codes": np.asarray(organism_codes, dtype=np.int32),
+            "reference_offsets": _offsets(reference_counts),
+            "reference_codes": np.asarray(reference_codes, dtype=np.int32),
+            "value": parsed.value,
+            "low": parsed.low,
+            "high": parsed.high,
+        }
+        return cls(
+            fields,
+            ec_numbers.terms,
+            compounds.terms,
+            organisms.terms,
+            references.terms,
+            columns,
+        )
+
+    def __len__(self):
+        return len(self.value)
+
+    def field_mask(self, field: str) -> np.ndarray:
+        """Rows belonging to BRENDA field ``field``."""
+        if field not in self.fields:
+            return np.zeros(len(self), dtype=bool)
+        return self.field == self.fields.index(field)
+
+    def compound_mask(self, compound: str) -> np.ndarray:
+        """Rows measured on exactly ``compound``."""
+        code = self._compound_codes.get(compound)
+        if code is None:
+            return np.zeros(len(self), dtype=bool)
+        return self.compound == code
+
+    def organism_mask(self, organism: str) -> np.ndarray:
+        """
+        Rows with at least one organism containing ``organism`` as a
+        case-insensitive substring (so a genus matches all of its species).
+        """
+        if self._organisms_lower is None:
+            self._organisms_lower = [o.lower() for o in self.organisms]
+        query = organism.lower()
+        matching = [i for i, o in enumerate(self._organisms_lower) if query in o]
+        return self.rows_with_organisms(matching)
+
+    def rows_with_organisms(self, codes) -> np.ndarray:
+        """Rows with at least one organism whose code is in ``codes``."""
+        if self._organism_rows is None:
+            # Row of every entry of organism_codes.
+            self._organism_rows = np.repeat(
+                np.arange(len(self), dtype=np.int64), np.diff(self.organism_offsets)
+            )
+        hits = np.isin(self.organism_codes, np.asarray(codes, dtype=np.int32))
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self._organism_rows[hits]] = True
+        return mask
+
+    def valid_mask(self) -> np.ndarray:
+        """Rows whose value parsed as a number."""
+        return ~np.isnan(self.value)
+
+
+def _offsets(counts: list) -> np.ndarray:
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
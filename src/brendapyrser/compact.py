@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Memory compaction of parsed BRENDA entries.
+
+The JSON decoder creates a new ``str`` object for every occurrence of a string,
+so a loaded database holds the same organism names, journal titles, field keys
+and stock comments ("wild-type enzyme", ...) many thousands of times.
+:func:`intern_strings` rebuilds an entry so that equal strings share a single
+object, and :func:`deep_size` measures how much memory an object graph holds.
+"""
+
+from __future__ import annotations
+
+import sys
+
+
+def intern_strings(obj, pool: dict):
+    """
+    Return a copy of the JSON-like ``obj`` (dicts, lists and the structs of
+    :mod:`brendapyrser.schema`) in which every string, dict keys included, is
+    replaced by the equal string stored in ``pool`` (adding it to
+    ``pool`` when first seen).
+    """
+    if isinstance(obj, str):
+        return pool.setdefault(obj, obj)
+    if isinstance(obj, dict):
+        return {
+            pool.setdefault(key, key) if isinstance(key, str) else key: intern_strings(
+                value, pool
+            )
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list):
+        return [intern_strings(value, pool) for value in obj]
+    names = getattr(type(obj), "__struct_fields__", None)
+    if names is not None:
+        return type(obj)(
+            **{name: intern_strings(getattr(obj, name), pool) for name in names}
+        )
+    return obj
+
+
+def deep_size(*objs) -> int:
+    """
+    Bytes held by ``objs`` and everything reachable from them through dicts,
+    lists and structs, counting objects shared between them only once.
+    """
+    seen = set()
+    size = 0
+    stack = list(objs)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+        elif hasattr(type(obj), "__struct_fields__"):
+            stack.extend(getattr(obj, name) for name in type(obj).__struct_fields__)
+    return size
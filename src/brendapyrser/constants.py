@@ -6,7 +6,8 @@ BRENDA data fields and units of measurement.
 
 ``fields`` maps the field names used by the BRENDA JSON schema
 (https://www.brenda-enzymes.org/schemas/docs/2.0.0) to a human-readable
-description. ``DATA_FIELDS`` lists the fields stored as arrays of value records.
+description. ``DATA_FIELDS`` lists the fields stored as arrays of value records
+and ``KINETIC_FIELDS`` the numeric ones among them.
 """
 
 fields = {
@@ -101,6 +102,15 @@ DATA_FIELDS = [
     "history",
 ]
 
+# Numeric fields whose values carry the measured compound as "number {compound}".
+KINETIC_FIELDS = [
+    "km_value",
+    "turnover_number",
+    "ki_value",
+    "kcat_km_value",
+    "specific_activity",
+]
+
 units = {
     "km_value": "mM",
     "ki_value": "mM",
@@ -14,25 +14,44 @@ accessions, structured citations with PMIDs, reversibility, etc.).
 
 from __future__ import annotations
 
-import gzip
-import io
-import json
 import re
-import tarfile
+import threading
+from collections.abc import Mapping
+from functools import partial, wraps
 from importlib import metadata
-from pathlib import Path
 
-import numpy as np
 import pandas as pd
 
-from .constants import fields, units
+from .arrow import _Dataset, build_tables, write_dataset
+from .columnar import ValueTable
+from .compact import deep_size, intern_strings
+from .constants import DATA_FIELDS, KINETIC_FIELDS, fields, units
+from .reader import (
+    _DecompressedCache,
+    _EntryIndex,
+    _get_decoder,
+    _is_compressed,
+    _iter_database,
+    _load_database,
+    _open_database,
+    _Progress,
+    _Snapshot,
+)
+from .schema import (
+    _require_msgspec,
+    check_schema_version,
+    decode_document,
+    decode_entry,
+    to_entry,
+)
+from .sqlite import _Store, build_database
+from .values import _split_value_unit, parse_values
 
 meta = metadata.metadata("brendapyrser")
 __version__ = meta["Version"]
 __author__ = meta["Author"]
 
 
-_VALUE_UNIT_RE = re.compile(r"^(?P<num>.*?)\s*\{(?P<unit>.*)\}\s*$")
 _REVERSIBILITY_RE = re.compile(r"\{(ir|r)\}")
 
 # BRENDA still embeds legacy annotations inside reaction-string values:
@@ -47,53 +66,6 @@ _PROTEIN_TAG_RE = re.compile(r"#\d+(?:,\d+)*#")
 _MULTISPACE_RE = re.compile(r"\s{2,}")
 
 
-def _load_database(path_to_database) -> dict:
-    """
-    Load a BRENDA JSON database, transparently handling a plain ``.json`` file,
-    a gzip-compressed ``.json.gz`` file, or a ``.json.tar.gz`` archive (the
-    format in which BRENDA currently distributes the database).
-    """
-    path = Path(path_to_database)
-    name = path.name.lower()
-
-    if name.endswith((".tar.gz", ".tgz")):
-        with tarfile.open(path, "r:gz") as tar:
-            members = [
-                m
-                for m in tar.getmembers()
-                if m.isfile() and m.name.lower().endswith(".json")
-            ]
-            if not members:
-                raise ValueError(f"No .json member found in archive '{path}'")
-            if len(members) > 1:
-                raise ValueError(
-                    f"Multiple .json members found in archive '{path}': "
-                    f"{[m.name for m in members]}"
-                )
-            fobj = tar.extractfile(members[0])
-            with io.TextIOWrapper(fobj, encoding="utf-8") as text:
-                return json.load(text)
-
-    if name.endswith(".gz"):
-        with gzip.open(path, "rt", encoding="utf-8") as fh:
-            return json.load(fh)
-
-    with open(path, encoding="utf-8") as fh:
-        return json.load(fh)
-
-
-def _split_value_unit(value: str):
-    """
-    Split a BRENDA value such as ``"0.045 {NADH}"`` into ``("0.045", "NADH")``.
-    Returns ``(number_part, brace_content)`` where ``brace_content`` is ``None``
-    when the value carries no ``{...}`` annotation.
-    """
-    match = _VALUE_UNIT_RE.match(value or "")
-    if match:
-        return match.group("num").strip(), match.group("unit").strip()
-    return (value or "").strip(), None
-
-
 def _clean_reaction_string(value: str) -> str:
     """
     Strip legacy annotations (``|...|`` comments, ``{...}`` reversibility and
@@ -121,26 +93,247 @@ def _split_reaction_side(side: str) -> list:
     ]
 
 
+# Entry keys loaded whatever ``fields`` are requested: they identify the enzyme
+# and resolve the protein and reference ids of every record.
+_ENTRY_KEYS = ("id", "recommended_name", "systematic_name", "protein", "reference")
+
+
 class BRENDA:
     """
     Provides methods to parse the BRENDA database (https://www.brenda-enzymes.org/)
     """
 
-    def __init__(self, path_to_database):
-        database = _load_database(path_to_database)
-        self.__release = database.get("release", "")
-        self.__schema_version = database.get("version", "")
-        data = database.get("data", {})
-        # Every key is an EC number except the "spontaneous" pseudo-entry, which
-        # is not an enzyme and is therefore excluded from the reaction list.
-        self.__reactions = [
-            Reaction(entry) for key, entry in data.items() if key != "spontaneous"
-        ]
+    def __init__(
+        self,
+        path_to_database,
+        streaming: bool = False,
+        lazy: bool = False,
+        snapshot=False,
+        compact: bool = False,
+        fields=None,
+        json_cache=False,
+        decoder: str = "auto",
+        typed: bool = False,
+        progress=None,
+    ):
+        """
+        Parse the BRENDA JSON database at ``path_to_database``.
+
+        With ``streaming=True`` the document is never materialised as a whole:
+        the ``data`` object is walked one EC entry at a time and each entry is
+        handed to :class:`Reaction` as soon as it has been decoded, keeping peak
+        memory close to that of the parsed reactions alone.
+
+        With ``lazy=True`` (uncompressed ``.json`` only) a byte-offset index of
+        the EC entries is built once and stored next to the file as
+        ``<file>.idx``; reactions are then created empty and each entry is only
+        read and decoded the first time one of its properties is accessed.
+
+        With ``snapshot=True`` the decoded entries are cached in a binary
+        snapshot next to the file (``<file>.snapshot``), or inside the directory
+        given as ``snapshot``, after the first parse; later runs load the
+        snapshot instead of parsing the JSON for as long as the source file and
+        the brendapyrser version are unchanged.
+
+        With ``compact=True`` equal strings of all entries (organism names,
+        journal titles, field keys, comments, ...) share a single object as
+        entries are loaded; see also :meth:`compact_memory`. It has no effect
+        in lazy mode, where entries are read one at a time on demand.
+
+        ``fields`` restricts the loaded data to the given fields of
+        ``constants.DATA_FIELDS``; names, proteins and references are always
+        kept. The document is then always streamed and the values of other
+        fields are skipped without being decoded (in snapshot mode the snapshot
+        still holds every field and is projected after loading).
+
+        With ``json_cache=True`` a compressed database (``.json.gz`` or
+        ``.json.tar.gz``) is decompressed once to ``<file>.json``, or into the
+        directory given as ``json_cache``, and read from that copy for as long
+        as the archive is unchanged. This also enables ``lazy=True`` for
+        archives.
+
+        ``decoder`` selects the JSON library used to decode whole documents
+        and lazily loaded entries from bytes: ``"json"`` (the standard
+        library), ``"orjson"``, ``"msgspec"`` or ``"simdjson"``. The default,
+        ``"auto"``, uses the first of these three that is installed; a
+        requested library that is not installed silently falls back to
+        ``"json"``. Streaming uses its own incremental decoder.
+
+        With ``typed=True`` (requires ``msgspec``) entries are decoded into the
+        fixed-layout structs of :mod:`brendapyrser.schema` instead of dicts,
+        validating them against the BRENDA JSON schema, and a document whose
+        schema version is not supported raises ``ValueError``. ``decoder`` is
+        then only used to read a document into a snapshot, which always holds
+        plain dicts.
+
+        ``progress``, if given, is called as ``progress(bytes_read,
+        total_bytes, entries, total_entries)`` while the database is read and
+        its entries are turned into reactions, e.g. to report how far a long
+        load has got. ``bytes_read`` counts bytes of the file on disk
+        (compressed or not) and ``total_entries`` is ``None`` while unknown, as
+        is always the case when streaming. Not used in lazy mode.
+        """
+        decode = decode_entry if typed else _get_decoder(decoder)
+        # Snapshots always hold plain dicts, whether or not they are loaded
+        # typed; the entries are converted when the reactions are built.
+        document_decoder = decoder
+        if typed:
+            _require_msgspec()
+            document_decoder = decode_document
+        keep = self.__projection(fields)
+        if json_cache and _is_compressed(path_to_database):
+            path_to_database = _DecompressedCache(path_to_database, json_cache).open()
+        tracker = None
+        if progress is not None and not lazy:
+            tracker = _Progress(progress, path_to_database)
+        if lazy:
+            index = _EntryIndex.open(path_to_database)
+            header = index.header
+            loaders = (
+                (ec_number, partial(index.load, ec_number, keep, decode))
+                for ec_number in index
+                if ec_number != "spontaneous"
+            )
+            if typed and keep is not None:
+                # Projected entries come out of the streaming decoder as dicts.
+                loaders = (
+                    (ec_number, partial(_load_typed, load))
+                    for ec_number, load in loaders
+                )
+            self.__reactions = ReactionList(
+                Reaction._deferred(ec_number, load) for ec_number, load in loaders
+            )
+        elif snapshot:
+            cache = _Snapshot(path_to_database, snapshot)
+            loaded = cache.load(__version__)
+            if loaded is None:
+                header, entries = self.__parse(
+                    path_to_database, streaming, decoder=decoder, tracker=tracker
+                )
+                entries = list(entries if tracker is None else tracker.count(entries))
+                cache.save(__version__, header, entries)
+            else:
+                header, entries = loaded
+                if tracker is not None:
+                    entries = tracker.count(entries)
+            if keep is not None:
+                entries = (
+                    (key, {k: v for k, v in entry.items() if k in keep})
+                    for key, entry in entries
+                )
+            self.__reactions = self.__build_reactions(entries, compact, typed)
+        else:
+            header, entries = self.__parse(
+                path_to_database,
+                streaming or keep is not None,
+                keep,
+                document_decoder,
+                tracker,
+            )
+            if tracker is not None:
+                entries = tracker.count(entries)
+            self.__reactions = self.__build_reactions(entries, compact, typed)
+        if typed:
+            check_schema_version(header.get("version"))
+        self.__setup(header)
+
+    @classmethod
+    def from_parquet(cls, directory) -> BRENDA:
+        """
+        Open a Parquet dataset written by :meth:`to_parquet` instead of the
+        JSON. Startup only decodes the EC number columns; each reaction is
+        rebuilt the first time one of its properties is accessed, by decoding
+        the row groups holding its rows. Requires ``pyarrow``.
+        """
+        dataset = _Dataset(directory)
+        database = cls.__new__(cls)
+        database.__reactions = ReactionList(
+            Reaction._deferred(ec_number, partial(dataset.load, ec_number))
+            for ec_number in dataset
+        )
+        database.__setup(dataset.header)
+        return database
+
+    @classmethod
+    def from_sqlite(cls, path) -> BRENDA:
+        """
+        Open a SQLite database written by :meth:`to_sqlite` (or by
+        the ``brendapyrser-sqlite`` command) read-only. EC number, name, compound
+        and organism lookups on :pyattr:`reactions` are answered with indexed
+        SQL queries, and each reaction is only read from the database the first
+        time one of its properties is accessed.
+        """
+        store = _Store(path)
+        database = cls.__new__(cls)
+        database.__reactions = _SQLiteReactionList(
+            (
+                Reaction._deferred(ec_number, partial(store.load, ec_number))
+                for ec_number in store.ec_numbers()
+            ),
+            store=store,
+        )
+        database.__setup(store.header)
+        return database
+
+    def __setup(self, header: dict):
+        self.__release = header.get("release", "")
+        self.__schema_version = header.get("version", "")
         self.__copyright = """Copyrighted by Dietmar Schomburg, Techn. University
         Braunschweig, GERMANY. Distributed under the License as stated
         at http:/www.brenda-enzymes.org"""
         self.__fields = fields
         self.__units = units
+        self.__value_tables = {}
+
+    @staticmethod
+    def __projection(fields):
+        """Keys kept in each entry when loading only ``fields`` (None: all)."""
+        if fields is None:
+            return None
+        fields = [fields] if isinstance(fields, str) else list(fields)
+        unknown = set(fields).difference(DATA_FIELDS, _ENTRY_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown BRENDA data fields: {sorted(unknown)}")
+        return frozenset(_ENTRY_KEYS).union(fields)
+
+    @staticmethod
+    def __parse(
+        path_to_database, streaming: bool, fields=None, decoder="auto", tracker=None
+    ):
+        """
+        Return ``(header, entries)`` where ``entries`` iterates over
+        ``(ec_number, entry)`` pairs, restricted to the keys in ``fields`` when
+        streaming. When streaming, ``header`` is only complete once ``entries``
+        has been exhausted. Reads are reported to ``tracker`` (a
+        :class:`~brendapyrser.reader._Progress`), if given.
+        """
+        on_read = tracker.read if tracker is not None else None
+        if not streaming:
+            header = _load_database(path_to_database, decoder, on_read)
+            return header, header.pop("data", {}).items()
+
+        header = {}
+
+        def entries():
+            with _open_database(path_to_database, on_read) as fh:
+                yield from _iter_database(fh, header, fields=fields)
+
+        return header, entries()
+
+    @staticmethod
+    def __build_reactions(
+        entries, compact: bool = False, typed: bool = False
+    ) -> ReactionList:
+        # Every key is an EC number except the "spontaneous" pseudo-entry, which
+        # is not an enzyme and is therefore excluded from the reaction list.
+        if typed:
+            entries = ((key, to_entry(entry)) for key, entry in entries)
+        if compact:
+            pool = {}
+            entries = ((key, intern_strings(entry, pool)) for key, entry in entries)
+        return ReactionList(
+            Reaction(entry) for key, entry in entries if key != "spontaneous"
+        )
 
     def _repr_html_(self):
         """This method is executed automatically by Jupyter to print html!"""
@@ -175,8 +368,14 @@ class BRENDA:
         return self.__units
 
     @property
-    def reactions(self):
-        return ReactionList(self.__reactions)
+    def reactions(self) -> ReactionList:
+        """
+        All enzyme entries, as a new :class:`ReactionList` on every access so
+        that modifying it leaves the database untouched. Until it is modified,
+        the copy answers lookups from the indexes of the database's own list,
+        which are therefore only built once per database.
+        """
+        return self.__reactions._copy()
 
     @property
     def copyright(self):
@@ -192,13 +391,89 @@ class BRENDA:
         """Version of the BRENDA JSON schema used by the loaded database."""
         return self.__schema_version
 
+    def value_table(self, fields=None) -> ValueTable:
+        """
+        Columnar NumPy table of every record of the numeric ``fields``
+        (``constants.KINETIC_FIELDS`` by default, or a single field name)
+        across the whole database. The table is built on first request and
+        reused afterwards.
+        """
+        if fields is None:
+            fields = KINETIC_FIELDS
+        key = (fields,) if isinstance(fields, str) else tuple(fields)
+        table = self.__value_tables.get(key)
+        if table is None:
+            table = ValueTable.from_reactions(self.__reactions, key)
+            self.__value_tables[key] = table
+        return table
+
+    def to_arrow(self) -> dict:
+        """
+        Flatten the database into ``{table_name: pyarrow.Table}``: one table per
+        field of ``constants.DATA_FIELDS`` plus ``enzymes``, ``proteins`` and
+        ``references`` (see :mod:`brendapyrser.arrow`). Requires ``pyarrow``.
+        """
+        return build_tables(self.__reactions)
+
+    def to_parquet(self, directory, max_workers=None):
+        """
+        Write :meth:`to_arrow` as a Parquet dataset under ``directory``, one
+        sub-directory per table partitioned by EC class (``ec_class=1``, ...),
+        with the files written in parallel by ``max_workers`` threads.
+        Returns the dataset directory as a :class:`pathlib.Path`.
+        """
+        header = {"release": self.__release, "version": self.__schema_version}
+        return write_dataset(
+            self.to_arrow(), directory, header, __version__, max_workers
+        )
+
+    def to_sqlite(self, path):
+        """
+        Write the database to a SQLite file at ``path`` (see
+        :mod:`brendapyrser.sqlite`), to be opened with :meth:`from_sqlite`.
+        Returns the path as a :class:`pathlib.Path`.
+        """
+        header = {"release": self.__release, "version": self.__schema_version}
+        return build_database(self.__reactions, path, header, __version__)
+
+    def compact_memory(self, drop_fields=()) -> dict:
+        """
+        Shrink the memory held by the loaded entries: equal strings across the
+        whole database are made to share one object and the data fields listed
+        in ``drop_fields`` (from ``constants.DATA_FIELDS``) are discarded.
+        Memoised views are dropped. Deferred reactions are loaded first.
+        Returns the size of the raw entries as ``{"bytes_before",
+        "bytes_after", "bytes_saved"}``.
+        """
+        unknown = set(drop_fields).difference(DATA_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown BRENDA data fields: {sorted(unknown)}")
+        before = deep_size(*(rxn._entry() for rxn in self.__reactions))
+        pool = {}
+        for rxn in self.__reactions:
+            rxn._compact(pool, frozenset(drop_fields))
+        del pool
+        after = deep_size(*(rxn._entry() for rxn in self.__reactions))
+        self.__value_tables.clear()
+        if drop_fields:
+            self.__reactions._invalidate_indexes()
+        return {
+            "bytes_before": before,
+            "bytes_after": after,
+            "bytes_saved": before - after,
+        }
+
     def getOrganisms(self) -> list:
         """
         Get list of all represented species in BRENDA
         """
+        store = getattr(self.__reactions, "_store", None)
         species = set()
-        for rxn in self.__reactions:
-            species.update(rxn.organisms)
+        if store is not None:
+            species.update(store.organisms())
+        else:
+            for rxn in self.__reactions:
+                species.update(rxn.organisms)
         species.discard("")
         return list({s for s in species if "no activity" not in s})
 
@@ -206,84 +481,378 @@ class BRENDA:
         """
         Get list of all substrates in BRENDA with KM data
         """
-        cpds = set()
-        for rxn in self.__reactions:
-            cpds.update(rxn.KMvalues.keys())
+        store = getattr(self.__reactions, "_store", None)
+        if store is not None:
+            cpds = set(store.compounds("km_value"))
+        else:
+            cpds = set()
+            for rxn in self.__reactions:
+                cpds.update(rxn.KMvalues.keys())
         cpds.discard("")
         return list(cpds)
 
 
+def _load_typed(load):
+    """Call ``load`` and convert the entry it returns into a typed entry."""
+    return to_entry(load())
+
+
+class _SubstringIndex:
+    """
+    Trigram index answering substring queries over a vocabulary of terms.
+
+    ``postings`` maps each term to its payload. A query of three or more
+    characters is resolved by intersecting the term sets of its trigrams and
+    verifying the few remaining candidates; shorter queries scan the vocabulary.
+    """
+
+    def __init__(self, postings: dict):
+        self.postings = postings
+        self.terms = list(postings)
+        trigrams = {}
+        for term_id, term in enumerate(self.terms):
+            for i in range(len(term) - 2):
+                trigrams.setdefault(term[i : i + 3], set()).add(term_id)
+        self.trigrams = trigrams
+
+    def search(self, query: str) -> list:
+        """Return the terms containing ``query``, in vocabulary order."""
+        if len(query) < 3:
+            return [term for term in self.terms if query in term]
+        candidates = None
+        for i in range(len(query) - 2):
+            term_ids = self.trigrams.get(query[i : i + 3])
+            if not term_ids:
+                return []
+            candidates = set(term_ids) if candidates is None else candidates & term_ids
+        return [
+            self.terms[term_id]
+            for term_id in sorted(candidates)
+            if query in self.terms[term_id]
+        ]
+
+
 class ReactionList(list):
+    """
+    List of :class:`Reaction` objects with hash indexes on EC number,
+    (case-folded) recommended name, natural substrates/products and organism
+    names. Each index is built on its first lookup and dropped whenever the list
+    is modified; slices and filter results are ``ReactionList`` objects with
+    indexes of their own.
+    """
+
+    _by_ec = None
+    _by_name = None
+    _by_compound = None
+    _by_organism = None
+    # List whose indexes this unmodified copy of it uses (see _copy).
+    _shared = None
+
     # Make ReactionList slicing return ReactionList object
     def __init__(self, seq=None):
-        super(self.__class__, self).__init__(seq)
+        super().__init__(seq if seq is not None else ())
 
     def __getslice__(self, start, stop):
-        return self.__class__(super(self.__class__, self).__getslice__(start, stop))
+        return self.__class__(super().__getslice__(start, stop))
 
     def __getitem__(self, key):
         if isinstance(key, slice):
-            return self.__class__(super(self.__class__, self).__getitem__(key))
+            return self.__class__(super().__getitem__(key))
         else:
-            return super(self.__class__, self).__getitem__(key)
+            return super().__getitem__(key)
+
+    def _copy(self) -> ReactionList:
+        """Copy of the list that uses this list's indexes until it is modified."""
+        copy = self.__class__(self)
+        copy._shared = self
+        return copy
+
+    def _invalidate_indexes(self):
+        self._shared = None
+        self._by_ec = self._by_name = None
+        self._by_compound = self._by_organism = None
+
+    def _ec_index(self) -> dict:
+        if self._shared is not None:
+            return self._shared._ec_index()
+        if self._by_ec is None:
+            index = {}
+            for rxn in self:
+                index.setdefault(rxn.ec_number, rxn)
+            self._by_ec = index
+        return self._by_ec
+
+    def _name_index(self) -> dict:
+        if self._shared is not None:
+            return self._shared._name_index()
+        if self._by_name is None:
+            index = {}
+            for rxn in self:
+                index.setdefault(rxn.name.casefold(), rxn)
+            self._by_name = index
+        return self._by_name
 
     def get_by_id(self, id: str):
         try:
-            return [rxn for rxn in self if rxn.ec_number == id][0]
-        except Exception:
+            return self._ec_index()[id]
+        except KeyError:
             raise ValueError(f"Enzyme with EC {id} not found in database")
 
     def get_by_name(self, name: str):
         try:
-            return [rxn for rxn in self if rxn.name.lower() == name.lower()][0]
-        except Exception:
+            return self._name_index()[name.casefold()]
+        except KeyError:
             raise ValueError(f"Enzyme {name} not found in database")
 
+    def get_many(self, ids) -> ReactionList:
+        """
+        Look up several EC numbers at once, returning the reactions in the
+        order of ``ids``.
+        """
+        ids = list(ids)
+        index = self._ec_index()
+        missing = [id for id in ids if id not in index]
+        if missing:
+            raise ValueError(f"Enzymes with EC {missing} not found in database")
+        return self.__class__([index[id] for id in ids])
+
+    def _compound_index(self) -> dict:
+        """
+        Inverted index ``{compound: [(position, role), ...]}`` over the natural
+        substrates/products of every reaction, ``role`` being ``"substrate"``
+        or ``"product"``. Postings are unique and in list order.
+        """
+        if self._shared is not None:
+            return self._shared._compound_index()
+        if self._by_compound is None:
+            index = {}
+            for position, rxn in enumerate(self):
+                postings = set()
+                for mets in rxn.substratesAndProducts:
+                    postings.update((c, "substrate") for c in mets["substrates"])
+                    postings.update((c, "product") for c in mets["products"])
+                for compound, role in postings:
+                    index.setdefault(compound, []).append((position, role))
+            self._by_compound = index
+        return self._by_compound
+
+    def __filter_by_roles(self, compound: str, roles: tuple) -> ReactionList:
+        positions = sorted(
+            {
+                position
+                for position, role in self._compound_index().get(compound, ())
+                if role in roles
+            }
+        )
+        return self.__class__([self[position] for position in positions])
+
     def filter_by_substrate(self, substrate: str) -> list[Reaction]:
         """
         Filter reactions by a specific substrate
         """
-        return [
-            rxn
-            for rxn in self
-            if any(
-                [substrate in mets["substrates"] for mets in rxn.substratesAndProducts]
-            )
-        ]
+        return self.__filter_by_roles(substrate, ("substrate",))
 
     def filter_by_product(self, product: str) -> list[Reaction]:
         """
         Filter reactions by a specific product
         """
-        return [
-            rxn
-            for rxn in self
-            if any([product in mets["products"] for mets in rxn.substratesAndProducts])
-        ]
+        return self.__filter_by_roles(product, ("product",))
 
     def filter_by_compound(self, compound: str) -> list[Reaction]:
         """
         Filter reactions by a substrate or product
         """
-        return [
-            rxn
-            for rxn in self
-            if any(
-                [
-                    (compound in mets["substrates"] or compound in mets["products"])
-                    for mets in rxn.substratesAndProducts
-                ]
+        return self.__filter_by_roles(compound, ("substrate", "product"))
+
+    def to_frame(self, field: str) -> pd.DataFrame:
+        """
+        Long-format DataFrame of every record of the BRENDA data ``field`` (any
+        of ``constants.DATA_FIELDS``) across these reactions, one row per record
+        and organism. Columns: ``ec_number``, ``compound`` (the ``{...}``
+        compound of kinetic values, ``""`` otherwise), ``text`` (the value
+        without its compound), numeric ``value``/``low``/``high`` parsed from
+        ``text`` (``NaN`` when not a number or range), ``organism``, ``comment``
+        and ``reference_ids``. Records are selected as the reaction properties
+        select them, so the ``{more}`` placeholders of kinetic fields are left
+        out. Repeated strings use categorical dtypes.
+        """
+        if field not in DATA_FIELDS:
+            raise ValueError(f"Unknown BRENDA data field: {field}")
+        columns = {
+            name: []
+            for name in (
+                "ec_number",
+                "compound",
+                "text",
+                "organism",
+                "comment",
+                "reference_ids",
             )
-        ]
+        }
+        for rxn in self:
+            entry = rxn._entry()
+            if not isinstance(entry.get(field), list):
+                continue
+            proteins = entry.get("protein", {})
+            for record, text, compound in rxn._value_records(field):
+                organisms = list(
+                    dict.fromkeys(
+                        proteins[pid].get("organism", "")
+                        for pid in record.get("proteins", [])
+                        if pid in proteins
+                    )
+                ) or [None]
+                for organism in organisms:
+                    columns["ec_number"].append(rxn.ec_number)
+                    columns["compound"].append(compound)
+                    columns["text"].append(text)
+                    columns["organism"].append(organism)
+                    columns["comment"].append(record.get("comment", ""))
+                    columns["reference_ids"].append(record.get("references", []))
+        parsed = parse_values(columns["text"])
+        return pd.DataFrame(
+            {
+                "ec_number": pd.Categorical(columns["ec_number"]),
+                "compound": pd.Categorical(columns["compound"]),
+                "text": pd.Categorical(columns["text"]),
+                "value": parsed.value,
+                "low": parsed.low,
+                "high": parsed.high,
+                "organism": pd.Categorical(columns["organism"]),
+                "comment": pd.Categorical(columns["comment"]),
+                "reference_ids": pd.Series(columns["reference_ids"], dtype=object),
+            }
+        )
+
+    def _organism_index(self) -> _SubstringIndex:
+        """Substring index over the lower-cased organism names of all reactions."""
+        if self._shared is not None:
+            return self._shared._organism_index()
+        if self._by_organism is None:
+            postings = {}
+            for position, rxn in enumerate(self):
+                for organism in rxn.organisms:
+                    postings.setdefault(organism.lower(), []).append(position)
+            self._by_organism = _SubstringIndex(postings)
+        return self._by_organism
 
     def filter_by_organism(self, species: str):
-        def is_contained(p, S):
-            return any([p in s.lower() for s in S])
+        """
+        Filter reactions by a case-insensitive substring of any of their
+        organism names, so a genus such as "Thermotoga" matches all its species.
+        """
+        index = self._organism_index()
+        positions = sorted(
+            {
+                position
+                for organism in index.search(species.lower())
+                for position in index.postings[organism]
+            }
+        )
+        return self.__class__([self[position] for position in positions])
 
-        return self.__class__(
-            [rxn for rxn in self if is_contained(species.lower(), rxn.organisms)]
+
+class _SQLiteReactionList(ReactionList):
+    """
+    :class:`ReactionList` of the reactions of a SQLite database (see
+    :meth:`BRENDA.from_sqlite`), whose lookups are answered by the database
+    instead of in-memory indexes. Once the list is modified, it falls back to
+    the in-memory indexes of :class:`ReactionList`.
+    """
+
+    _store = None
+
+    def __init__(self, seq=None, store=None):
+        super().__init__(seq)
+        self._store = store
+
+    def _copy(self) -> ReactionList:
+        copy = super()._copy()
+        copy._store = self._store
+        return copy
+
+    def _invalidate_indexes(self):
+        self._store = None
+        super()._invalidate_indexes()
+
+    def __at(self, positions: list) -> ReactionList:
+        return ReactionList([self[position] for position in positions])
+
+    def get_by_id(self, id: str):
+        if self._store is None:
+            return super().get_by_id(id)
+        position = self._store.position(id)
+        if position is None:
+            raise ValueError(f"Enzyme with EC {id} not found in database")
+        return self[position]
+
+    def get_by_name(self, name: str):
+        if self._store is None:
+            return super().get_by_name(name)
+        position = self._store.position_by_name(name)
+        if position is None:
+            raise ValueError(f"Enzyme {name} not found in database")
+        return self[position]
+
+    def get_many(self, ids) -> ReactionList:
+        if self._store is None:
+            return super().get_many(ids)
+        ids = list(ids)
+        positions = [self._store.position(id) for id in ids]
+        missing = [id for id, position in zip(ids, positions) if position is None]
+        if missing:
+            raise ValueError(f"Enzymes with EC {missing} not found in database")
+        return self.__at(positions)
+
+    def filter_by_substrate(self, substrate: str) -> list[Reaction]:
+        if self._store is None:
+            return super().filter_by_substrate(substrate)
+        return self.__at(self._store.positions_with_compound(substrate, ("substrate",)))
+
+    def filter_by_product(self, product: str) -> list[Reaction]:
+        if self._store is None:
+            return super().filter_by_product(product)
+        return self.__at(self._store.positions_with_compound(product, ("product",)))
+
+    def filter_by_compound(self, compound: str) -> list[Reaction]:
+        if self._store is None:
+            return super().filter_by_compound(compound)
+        return self.__at(
+            self._store.positions_with_compound(compound, ("substrate", "product"))
         )
 
+    def filter_by_organism(self, species: str):
+        if self._store is None:
+            return super().filter_by_organism(species)
+        return self.__at(self._store.positions_with_organism(species))
+
+
+def _invalidates_indexes(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._invalidate_indexes()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+for _method in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(ReactionList, _method, _invalidates_indexes(getattr(list, _method)))
+del _method
+
 
 class EnzymeDict(dict):
     def filter_by_organism(self, species: str):
@@ -322,8 +891,51 @@ class EnzymeConditionDict(EnzymeDict):
             )
 
 
+def _copy_view(view):
+    """Copy the dict/list skeleton of a derived view, sharing its immutable leaves."""
+    if isinstance(view, dict):
+        return view.__class__({k: _copy_view(v) for k, v in view.items()})
+    if isinstance(view, list):
+        return [_copy_view(v) for v in view]
+    return view
+
+
+def _cached_view(method):
+    """Memoise a derived :class:`Reaction` view under the method's name."""
+
+    @wraps(method)
+    def wrapper(self):
+        return self._view(method.__name__, partial(method, self))
+
+    return wrapper
+
+
 class Reaction:
+    # Derived views (KMvalues, temperature, references, ...) are built once per
+    # reaction and memoised; callers always receive a copy, so they cannot
+    # corrupt the cache. Set ``cache_views = False`` to rebuild on every access,
+    # or bound the number of views kept per reaction with ``max_cached_views``
+    # (least recently used views are evicted first).
+    cache_views = True
+    max_cached_views = None
+
+    # Reactions are numerous, so they carry no per-instance __dict__.
+    __slots__ = (
+        "__views",
+        "__citations",
+        "__entry",
+        "__ec_number",
+        "__name",
+        "__systematic_name",
+        "__proteins_raw",
+        "__references_raw",
+        "__loader",
+        "__load_lock",
+    )
+
     def __init__(self, entry: dict):
+        self.__views = {}
+        self.__citations = {}
         self.__entry = entry
         self.__ec_number = entry.get("id", "")
         self.__name = entry.get("recommended_name", "")
@@ -331,26 +943,108 @@ class Reaction:
         self.__proteins_raw = entry.get("protein", {})
         self.__references_raw = entry.get("reference", {})
 
+    @classmethod
+    def _deferred(cls, ec_number: str, loader) -> Reaction:
+        """
+        Create a reaction whose entry is only fetched, by calling ``loader()``,
+        the first time anything beyond its EC number is accessed.
+        """
+        rxn = cls.__new__(cls)
+        rxn.__ec_number = ec_number
+        rxn.__loader = loader
+        rxn.__load_lock = threading.Lock()
+        return rxn
+
+    def __getattr__(self, name):
+        # Only reached for attributes that are not set, i.e. on a deferred
+        # reaction whose entry has not been loaded yet. The lock makes threads
+        # touching it at once wait for a single load, and the loader is only
+        # dropped once the entry is in place, so a failed load can be retried.
+        if name in ("_Reaction__loader", "_Reaction__load_lock"):
+            raise AttributeError(name)
+        try:
+            lock = self.__load_lock
+        except AttributeError:
+            raise AttributeError(name) from None
+        with lock:
+            try:
+                loader = self.__loader
+            except AttributeError:
+                pass  # loaded by another thread meanwhile
+            else:
+                self.__init__(loader())
+                del self.__loader
+        return object.__getattribute__(self, name)
+
+    def _is_loaded(self) -> bool:
+        """Whether the entry of this reaction has been read (see ``_deferred``)."""
+        try:
+            self.__loader
+        except AttributeError:
+            return True
+        return False
+
+    def _compact(self, pool: dict, drop_fields=()):
+        """
+        Re-create this reaction from a copy of its entry without ``drop_fields``
+        whose strings are interned in ``pool`` (see :func:`intern_strings`).
+        """
+        entry = self._entry()
+        if drop_fields:
+            entry = type(entry)(
+                **{k: v for k, v in entry.items() if k not in drop_fields}
+            )
+        self.__init__(intern_strings(entry, pool))
+
+    def _entry(self) -> dict:
+        """The raw BRENDA entry of this reaction (shared, not a copy)."""
+        return self.__entry
+
+    def _view(self, key, build):
+        """Return a copy of the memoised view ``key``, building it if needed."""
+        if not self.cache_views:
+            return build()
+        views = self.__views
+        # Re-inserting on every hit makes dict order least-recently-used order.
+        view = views.pop(key, None)
+        if view is None:
+            view = build()
+        views[key] = view
+        if self.max_cached_views is not None:
+            while views and len(views) > self.max_cached_views:
+                del views[next(iter(views))]
+        return _copy_view(view)
+
+    def clear_cache(self):
+        """Drop all memoised views and formatted citations of this reaction."""
+        self.__views.clear()
+        self.__citations.clear()
+
     # ------------------------------------------------------------------ #
     # Internal helpers                                                    #
     # ------------------------------------------------------------------ #
     @staticmethod
-    def __eval_range_value(v):
-        """Evaluate a single numeric value, averaging ``a-b`` ranges."""
-        try:
-            if not re.search(r"\d-\d", v):
-                return float(v)
-            return float(np.mean([float(s) for s in v.split("-")]))
-        except Exception:
-            return -999
+    def __point_values(numbers: list) -> list:
+        """Batch-parse value strings, averaging ``a-b`` ranges (-999 if invalid)."""
+        parsed = parse_values(numbers)
+        return [
+            value if valid else -999
+            for value, valid in zip(parsed.value.tolist(), parsed.valid.tolist())
+        ]
 
     @staticmethod
-    def __eval_range_pair(v):
-        """Evaluate a numeric range ``a-b`` into ``[a, b]``."""
-        try:
-            return [float(s) for s in v.split("-")]
-        except Exception:
-            return [-999, -999]
+    def __range_values(numbers: list) -> list:
+        """Batch-parse ``a-b`` ranges into ``[a, b]`` pairs (-999s if invalid)."""
+        parsed = parse_values(numbers)
+        return [
+            ([low, high] if is_range else [low]) if valid else [-999, -999]
+            for low, high, valid, is_range in zip(
+                parsed.low.tolist(),
+                parsed.high.tolist(),
+                parsed.valid.tolist(),
+                parsed.is_range.tolist(),
+            )
+        ]
 
     @staticmethod
     def __format_citation(ref: dict) -> str:
@@ -383,13 +1077,17 @@ class Reaction:
             }
         )
 
+    def __citation(self, rid: str) -> str:
+        """Citation string of one reference, formatted once per reaction."""
+        citation = self.__citations.get(rid)
+        if citation is None:
+            citation = self.__format_citation(self.__references_raw[rid])
+            self.__citations[rid] = citation
+        return citation
+
     def __citations_for(self, ref_ids: list) -> list:
         """Map BRENDA reference ids to full citation strings."""
-        return [
-            self.__format_citation(self.__references_raw[rid])
-            for rid in ref_ids
-            if rid in self.__references_raw
-        ]
+        return [self.__citation(rid) for rid in ref_ids if rid in self.__references_raw]
 
     def __getDictOfEnzymeActuators(self, field: str) -> EnzymePropertyDict:
         res = {}
@@ -403,16 +1101,35 @@ class Reaction:
                 }
         return EnzymePropertyDict(res)
 
-    def __getDictOfEnzymeProperties(self, field: str) -> EnzymePropertyDict:
-        res = {}
+    def _value_records(self, field: str) -> list:
+        """
+        ``(record, number, compound)`` for every record of a data field. For
+        kinetic fields the ``{...}`` compound is split off the number (``""``
+        when absent) and ``{more}`` placeholders are dropped, except for
+        specific activities, whose annotation is not a compound.
+        """
+        kinetic = field in KINETIC_FIELDS
+        res = []
         for record in self.__entry.get(field, []):
-            number, substrate = _split_value_unit(record.get("value", ""))
-            substrate = substrate if substrate is not None else ""
-            if substrate == "more":
+            if not isinstance(record, Mapping):
                 continue
+            number, compound = record.get("value", ""), ""
+            if kinetic:
+                number, compound = _split_value_unit(number)
+                compound = compound if compound is not None else ""
+                if compound == "more" and field != "specific_activity":
+                    continue
+            res.append((record, number, compound))
+        return res
+
+    def __getDictOfEnzymeProperties(self, field: str) -> EnzymePropertyDict:
+        records = self._value_records(field)
+        values = self.__point_values([number for _, number, _ in records])
+        res = {}
+        for (record, _, substrate), value in zip(records, values):
             res.setdefault(substrate, []).append(
                 {
-                    "value": self.__eval_range_value(number),
+                    "value": value,
                     "species": self.__organisms_for(record.get("proteins", [])),
                     "meta": record.get("comment", ""),
                     "refs": self.__citations_for(record.get("references", [])),
@@ -421,23 +1138,33 @@ class Reaction:
         return EnzymePropertyDict(res)
 
     def __extractTempOrPHData(self, field: str, is_range: bool) -> list:
-        values = []
-        for record in self.__entry.get(field, []):
-            raw = record.get("value", "")
-            value = (
-                self.__eval_range_pair(raw)
-                if is_range
-                else self.__eval_range_value(raw)
-            )
-            values.append(
-                {
-                    "value": value,
-                    "species": self.__organisms_for(record.get("proteins", [])),
-                    "meta": record.get("comment", ""),
-                    "refs": record.get("references", []),
-                }
+        records = self._value_records(field)
+        numbers = [number for _, number, _ in records]
+        parse = self.__range_values if is_range else self.__point_values
+        return [
+            {
+                "value": value,
+                "species": self.__organisms_for(record.get("proteins", [])),
+                "meta": record.get("comment", ""),
+                "refs": record.get("references", []),
+            }
+            for (record, _, _), value in zip(records, parse(numbers))
+        ]
+
+    def _numeric_records(self, field: str):
+        """
+        Yield ``(compound, number, organisms, reference_ids)`` for every record
+        of a numeric field, selected and split as the corresponding properties
+        do; ``number`` is the unparsed value string (see
+        :func:`brendapyrser.values.parse_values`).
+        """
+        for record, number, compound in self._value_records(field):
+            yield (
+                compound,
+                number,
+                self.__organisms_for(record.get("proteins", [])),
+                record.get("references", []),
             )
-        return values
 
     def field(self, name: str) -> list:
         """
@@ -446,9 +1173,12 @@ class Reaction:
         reference ids resolved to organism names and full citations. Useful for
         fields without a dedicated property (e.g. ``cloned``, ``application``).
         """
+        return self._view(("field", name), partial(self.__field, name))
+
+    def __field(self, name: str) -> list:
         enriched = []
         for record in self.__entry.get(name, []):
-            if not isinstance(record, dict):
+            if not isinstance(record, Mapping):
                 continue
             enriched.append(
                 {
@@ -522,62 +1252,73 @@ class Reaction:
         return reactions[0].get("value", "") if reactions else ""
 
     @property
+    @_cached_view
     def mechanism(self) -> list[str]:
         return [r.get("value", "") for r in self.__entry.get("reaction", [])]
 
     @property
+    @_cached_view
     def reaction_type(self) -> list[str]:
         return [r.get("value", "") for r in self.__entry.get("reaction_type", [])]
 
     @property
+    @_cached_view
     def cofactors(self):
         return self.__getDictOfEnzymeActuators("cofactor")
 
     @property
+    @_cached_view
     def metals(self):
         return self.__getDictOfEnzymeActuators("metals_ions")
 
     @property
+    @_cached_view
     def inhibitors(self):
         return self.__getDictOfEnzymeActuators("inhibitor")
 
     @property
+    @_cached_view
     def activators(self):
         return self.__getDictOfEnzymeActuators("activating_compound")
 
     @property
+    @_cached_view
     def KMvalues(self):
         return self.__getDictOfEnzymeProperties("km_value")
 
     @property
+    @_cached_view
     def KIvalues(self):
         return self.__getDictOfEnzymeProperties("ki_value")
 
     @property
+    @_cached_view
     def KKMvalues(self):
         return self.__getDictOfEnzymeProperties("kcat_km_value")
 
     @property
+    @_cached_view
     def Kcatvalues(self):
         return self.__getDictOfEnzymeProperties("turnover_number")
 
     @property
+    @_cached_view
     def specificActivities(self):
-        res = []
-        for record in self.__entry.get("specific_activity", []):
-            number, _ = _split_value_unit(record.get("value", ""))
-            res.append(
-                {
-                    "value": self.__eval_range_value(number),
-                    "species": self.__organisms_for(record.get("proteins", [])),
-                    "meta": record.get("comment", ""),
-                    "refs": self.__citations_for(record.get("references", [])),
-                    "specific_info": "",
-                }
-            )
-        return res
+        records = self._value_records("specific_activity")
+        values = self.__point_values([number for _, number, _ in records])
+        return [
+            {
+                "value": value,
+                "species": self.__organisms_for(record.get("proteins", [])),
+                "meta": record.get("comment", ""),
+                "refs": self.__citations_for(record.get("references", [])),
+                "specific_info": "",
+            }
+            for (record, _, _), value in zip(records, values)
+        ]
 
     @property
+    @_cached_view
     def substratesAndProducts(self) -> list:
         """
         Returns list of dicts with evaluated "natural" substrates and products
@@ -598,6 +1339,7 @@ class Reaction:
         return res
 
     @property
+    @_cached_view
     def substrates_products(self) -> list:
         """
         All catalogued substrate/product pairs (BRENDA ``substrates_products``),
@@ -629,6 +1371,7 @@ class Reaction:
         return res
 
     @property
+    @_cached_view
     def synonyms(self) -> list:
         return [r.get("value", "") for r in self.__entry.get("synonyms", [])]
 
@@ -657,6 +1400,7 @@ class Reaction:
         return self.field("localization")
 
     @property
+    @_cached_view
     def temperature(self):
         return EnzymeConditionDict(
             {
@@ -667,6 +1411,7 @@ class Reaction:
         )
 
     @property
+    @_cached_view
     def PH(self):
         return EnzymeConditionDict(
             {
@@ -677,6 +1422,7 @@ class Reaction:
         )
 
     @property
+    @_cached_view
     def proteins(self) -> dict:
         """
         Returns a dict listing all proteins for the given EC number, keyed by
@@ -698,6 +1444,7 @@ class Reaction:
         return result
 
     @property
+    @_cached_view
     def organisms(self) -> list:
         """
         Returns a list containing all represented species in the database for this reaction
@@ -707,15 +1454,13 @@ class Reaction:
         return organisms
 
     @property
+    @_cached_view
     def references(self) -> dict:
         """
         Bibliography cited for this EC number as ``{id: citation_string}``.
         See :pyattr:`bibliography` for the structured records.
         """
-        return {
-            rid: self.__format_citation(ref)
-            for rid, ref in self.__references_raw.items()
-        }
+        return {rid: self.__citation(rid) for rid in self.__references_raw}
 
     @property
     def bibliography(self) -> dict:
@@ -723,4 +1468,4 @@ class Reaction:
         Structured bibliography as ``{id: {title, authors, journal, year, vol,
         pages, pmid}}``.
         """
-        return self.__references_raw
+        return {rid: dict(ref) for rid, ref in self.__references_raw.items()}
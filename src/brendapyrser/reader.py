@@ -0,0 +1,609 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Low-level readers for the BRENDA JSON document.
+
+BRENDA ships the whole database as one JSON object of the form
+``{"release": ..., "version": ..., "data": {<ec>: <entry>, ...}}``. Besides the
+plain ``json.load`` path, this module provides a streaming reader that walks the
+``data`` object one EC entry at a time, so that only a single entry is decoded
+and held in memory at any point of the scan.
+"""
+
+from __future__ import annotations
+
+import codecs
+import gzip
+import hashlib
+import io
+import json
+import os
+import pickle
+import re
+import shutil
+import tarfile
+from contextlib import contextmanager
+from pathlib import Path
+
+# Optional faster inflate: python-isal or zlib-ng decompress gzip on a
+# background thread, in parallel with JSON decoding.
+try:
+    from isal import igzip_threaded as _threaded_gzip
+except ImportError:  # pragma: no cover - optional dependency
+    try:
+        from zlib_ng import gzip_ng_threaded as _threaded_gzip
+    except ImportError:
+        _threaded_gzip = None
+
+# Optional faster JSON decoders, all decoding straight from bytes.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+try:
+    import msgspec.json
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - optional dependency
+    simdjson = None
+
+# Names accepted by ``_get_decoder``; "auto" picks the first installed one of
+# orjson, msgspec and simdjson, in that order, and the stdlib otherwise.
+DECODERS = ("auto", "json", "orjson", "msgspec", "simdjson")
+
+# Bytes requested from the underlying stream per read while streaming.
+CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = " \t\n\r"
+# Characters that open or close a JSON container or string, and the rest of a
+# string after its opening quote.
+_STRUCTURE_RE = re.compile(r'["{}\[\]]')
+_STRING_TAIL_RE = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"')
+
+
+def _gzip_open(fileobj):
+    """
+    Decompress a gzip file (a path or a binary file object) for reading, on the
+    fastest inflate available.
+    """
+    if _threaded_gzip is not None:
+        return _threaded_gzip.open(fileobj, "rb", threads=1)
+    return gzip.open(fileobj, "rb")
+
+
+def _is_compressed(path) -> bool:
+    return Path(path).name.lower().endswith((".gz", ".tgz"))
+
+
+class _CountingReader(io.RawIOBase):
+    """Binary reader over ``raw`` calling ``on_read(bytes_read)`` after reads."""
+
+    def __init__(self, raw, on_read):
+        self.raw = raw
+        self.on_read = on_read
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        count = self.raw.readinto(buffer)
+        self.bytes_read += count or 0
+        self.on_read(self.bytes_read)
+        return count
+
+
+class _Progress:
+    """
+    Reports the progress of a database load to ``callback(bytes_read,
+    total_bytes, entries, total_entries)``, after every read from the file
+    (see :func:`_open_database`) and every entry handed out by :meth:`count`.
+    ``bytes_read`` counts bytes of the file on disk, compressed or not;
+    ``total_entries`` is ``None`` until known (it never is when streaming).
+    """
+
+    def __init__(self, callback, path_to_database):
+        self.callback = callback
+        self.total_bytes = os.path.getsize(path_to_database)
+        self.bytes_read = 0
+        self.entries = 0
+        self.total_entries = None
+
+    def read(self, bytes_read: int):
+        self.bytes_read = bytes_read
+        self.report()
+
+    def count(self, entries):
+        """Iterate over ``entries``, reporting each one."""
+        if hasattr(entries, "__len__"):
+            self.total_entries = len(entries)
+        for entry in entries:
+            self.entries += 1
+            self.report()
+            yield entry
+
+    def report(self):
+        self.callback(
+            self.bytes_read, self.total_bytes, self.entries, self.total_entries
+        )
+
+
+@contextmanager
+def _open_database(path_to_database, on_read=None):
+    """
+    Open a BRENDA JSON database as a binary stream, transparently handling a
+    plain ``.json`` file, a gzip-compressed ``.json.gz`` file, or a
+    ``.json.tar.gz`` archive (the format in which BRENDA currently distributes
+    the database). Archives are read as a stream: the ``.json`` member is
+    handed out as soon as its header is found, without listing the archive.
+    ``on_read(bytes_read)``, if given, is called as the file on disk is read.
+    """
+    path = Path(path_to_database)
+    name = path.name.lower()
+
+    with open(path, "rb") as fh:
+        if on_read is not None:
+            fh = io.BufferedReader(_CountingReader(fh, on_read), CHUNK_SIZE)
+        with _open_stream(fh, path, name) as stream:
+            yield stream
+
+
+@contextmanager
+def _open_stream(fh, path, name):
+    """The decompressed JSON stream of the database file ``fh``."""
+    if name.endswith((".tar.gz", ".tgz")):
+        with _gzip_open(fh) as raw, tarfile.open(fileobj=raw, mode="r|") as tar:
+            members = (
+                m for m in tar if m.isfile() and m.name.lower().endswith(".json")
+            )
+            member = next(members, None)
+            if member is None:
+                raise ValueError(f"No .json member found in archive '{path}'")
+            with tar.extractfile(member) as fobj:
+                yield fobj
+            # Later members can only be seen once the first one has been read.
+            extra = [m.name for m in members]
+            if extra:
+                raise ValueError(
+                    f"Multiple .json members found in archive '{path}': "
+                    f"{[member.name, *extra]}"
+                )
+        return
+
+    if name.endswith(".gz"):
+        with _gzip_open(fh) as raw:
+            yield raw
+        return
+
+    yield fh
+
+
+def _get_decoder(name: str = "auto"):
+    """
+    Return the function decoding a JSON document from bytes for decoder
+    ``name`` (see ``DECODERS``), falling back to ``json.loads`` when the
+    requested library is not installed.
+    """
+    if name not in DECODERS:
+        raise ValueError(f"Unknown JSON decoder {name!r}, expected one of {DECODERS}")
+    available = {}
+    if orjson is not None:
+        available["orjson"] = orjson.loads
+    if msgspec is not None:
+        available["msgspec"] = msgspec.json.decode
+    if simdjson is not None:
+        available["simdjson"] = simdjson.loads
+    available["json"] = json.loads
+    if name == "auto":
+        return next(iter(available.values()))
+    return available.get(name, json.loads)
+
+
+def _load_database(path_to_database, decoder: str = "auto", on_read=None) -> dict:
+    """
+    Load a whole BRENDA JSON database into memory, decoding the raw bytes with
+    the given decoder (a name for :func:`_get_decoder`, or a function).
+    """
+    decode = decoder if callable(decoder) else _get_decoder(decoder)
+    with _open_database(path_to_database, on_read) as fh:
+        return decode(fh.read())
+
+
+class _JSONStream:
+    """
+    Incremental tokenizer over a binary UTF-8 JSON stream.
+
+    Text is decoded chunk by chunk into a sliding buffer; complete values are
+    decoded with :meth:`json.JSONDecoder.raw_decode`, reading further chunks
+    whenever a value is cut off at the end of the buffer.
+    """
+
+    def __init__(self, fh, chunk_size: int = CHUNK_SIZE, track_offsets: bool = False):
+        self._fh = fh
+        self._chunk_size = chunk_size
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        # Byte offset of the buffer character at index ``_mark``; only kept up
+        # to date when offsets are tracked, since it costs an extra encode.
+        self._track_offsets = track_offsets
+        self._mark = 0
+        self._mark_offset = 0
+
+    def _fill(self, size: int = 0) -> bool:
+        """Append at least ``size`` more bytes of text to the buffer."""
+        if self._eof:
+            return False
+        # Drop the consumed prefix so the buffer only holds unread text.
+        if self._pos:
+            if self._track_offsets:
+                self.tell()
+                self._mark = 0
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        raw = self._fh.read(max(size, self._chunk_size))
+        if not raw:
+            self._eof = True
+            self._buf += self._utf8.decode(b"", final=True)
+            return False
+        self._buf += self._utf8.decode(raw)
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of input)."""
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def tell(self) -> int:
+        """Byte offset, in the underlying stream, of the current position."""
+        segment = self._buf[self._mark : self._pos]
+        self._mark_offset += (
+            len(segment) if segment.isascii() else len(segment.encode("utf-8"))
+        )
+        self._mark = self._pos
+        return self._mark_offset
+
+    def expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise ValueError(
+                f"Malformed BRENDA JSON: expected {char!r}, found {found or 'EOF'!r}"
+            )
+        self._pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self._peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill(len(self._buf) - self._pos):
+                    continue
+                raise
+            # A number ending exactly at the buffer edge may continue in the
+            # next chunk; only trust it once a delimiter follows.
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+    def skip(self) -> None:
+        """
+        Move past the next JSON value without decoding it, so that skipped
+        objects and arrays never allocate Python objects.
+        """
+        if self._peek() not in "{[":
+            self.value()
+            return
+        depth = 0
+        while True:
+            match = _STRUCTURE_RE.search(self._buf, self._pos)
+            if match is None:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    raise ValueError("Malformed BRENDA JSON: unexpected EOF")
+                continue
+            if match.group() == '"':
+                tail = _STRING_TAIL_RE.match(self._buf, match.end())
+                if tail is None:
+                    # The string continues past the end of the buffer.
+                    self._pos = match.start()
+                    if not self._fill(len(self._buf) - self._pos):
+                        raise ValueError("Malformed BRENDA JSON: unexpected EOF")
+                    continue
+                self._pos = tail.end()
+                continue
+            self._pos = match.end()
+            depth += 1 if match.group() in "{[" else -1
+            if depth == 0:
+                return
+
+    def entry(self, fields=None):
+        """
+        Decode the next EC entry, keeping only the keys in ``fields`` (all keys
+        when ``None``); the values of other keys are skipped undecoded.
+        """
+        if fields is None or self._peek() != "{":
+            return self.value()
+        entry = {}
+        for key in self.members():
+            if key in fields:
+                entry[key] = self.value()
+            else:
+                self.skip()
+        return entry
+
+    def members(self):
+        """
+        Iterate over the keys of the JSON object at the current position. The
+        caller must consume each member's value before requesting the next key.
+        """
+        self.expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self._peek() == ",":
+                self._pos += 1
+                continue
+            self.expect("}")
+            return
+
+
+def _iter_database(fh, header: dict, chunk_size: int = CHUNK_SIZE, fields=None):
+    """
+    Stream ``(ec_number, entry)`` pairs from the ``data`` object of an open
+    BRENDA JSON stream, one entry at a time. Top-level scalars such as
+    ``release`` and ``version`` are stored into ``header`` as they are read.
+    When ``fields`` is given, entries only hold those keys.
+    """
+    stream = _JSONStream(fh, chunk_size)
+    for key in stream.members():
+        if key == "data":
+            for ec_number in stream.members():
+                yield ec_number, stream.entry(fields)
+        else:
+            header[key] = stream.value()
+
+
+def _scan_offsets(fh, header: dict, chunk_size: int = CHUNK_SIZE):
+    """
+    Like :func:`_iter_database`, but yield ``(ec_number, offset, length)`` with
+    the byte span of each entry's JSON text instead of the decoded entry.
+    """
+    stream = _JSONStream(fh, chunk_size, track_offsets=True)
+    for key in stream.members():
+        if key == "data":
+            for ec_number in stream.members():
+                stream._peek()
+                start = stream.tell()
+                stream.value()
+                yield ec_number, start, stream.tell() - start
+        else:
+            header[key] = stream.value()
+
+
+class _EntryIndex:
+    """
+    Byte-offset index of the EC entries of an uncompressed BRENDA JSON file.
+
+    The index is built by one streaming scan of the file and persisted next to
+    it (``<file>.idx``), keyed by the file's size and modification time so that
+    a replaced database is re-indexed. Single entries are then decoded on
+    demand by seeking straight to their byte span.
+    """
+
+    # Bumped whenever the on-disk layout of the index changes.
+    FORMAT = 1
+
+    def __init__(self, path, header: dict, spans: dict):
+        self.path = Path(path)
+        self.header = header
+        self.spans = spans
+
+    @staticmethod
+    def index_path(path) -> Path:
+        return Path(f"{path}.idx")
+
+    @staticmethod
+    def _stamp(path) -> dict:
+        stat = os.stat(path)
+        return {
+            "format": _EntryIndex.FORMAT,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+        }
+
+    @classmethod
+    def open(cls, path) -> _EntryIndex:
+        """Load the persisted index of ``path``, (re)building it when stale."""
+        path = Path(path)
+        if _is_compressed(path):
+            raise ValueError(
+                f"Lazy loading needs an uncompressed .json database (or json_cache), "
+                f"got '{path}'"
+            )
+        stamp = cls._stamp(path)
+        index_path = cls.index_path(path)
+        try:
+            with open(index_path, encoding="utf-8") as fh:
+                stored = json.load(fh)
+            if stored.get("stamp") == stamp:
+                return cls(path, stored["header"], stored["spans"])
+        except (OSError, ValueError, KeyError):
+            pass
+
+        header = {}
+        with open(path, "rb") as fh:
+            spans = {
+                ec_number: [offset, length]
+                for ec_number, offset, length in _scan_offsets(fh, header)
+            }
+        index = cls(path, header, spans)
+        index.save(index_path, stamp)
+        return index
+
+    def save(self, index_path, stamp: dict) -> None:
+        """Persist the index atomically; a read-only location is not an error."""
+        tmp_path = Path(f"{index_path}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump(
+                    {"stamp": stamp, "header": self.header, "spans": self.spans}, fh
+                )
+            os.replace(tmp_path, index_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def __iter__(self):
+        return iter(self.spans)
+
+    def __len__(self):
+        return len(self.spans)
+
+    def load(self, ec_number: str, fields=None, decode=json.loads) -> dict:
+        """
+        Seek to and decode (with ``decode``) the entry of a single EC number,
+        keeping only the keys in ``fields`` if given.
+        """
+        offset, length = self.spans[ec_number]
+        with open(self.path, "rb") as fh:
+            fh.seek(offset)
+            raw = fh.read(length)
+        if fields is None:
+            return decode(raw)
+        return _JSONStream(io.BytesIO(raw), max(length, 1)).entry(fields)
+
+
+class _Snapshot:
+    """
+    Binary (pickle protocol 5) snapshot of a parsed BRENDA database.
+
+    A snapshot file holds two consecutive pickles: a small key describing the
+    source file (size, modification time, SHA-256 digest) and the brendapyrser
+    version that wrote it, followed by the header and the decoded entries. The
+    key is checked before the (large) payload is unpickled. Snapshots are
+    trusted local caches: never load one from an untrusted location.
+    """
+
+    SUFFIX = ".snapshot"
+
+    def __init__(self, source, location=True):
+        self.source = Path(source)
+        if location is True:
+            self.path = Path(f"{self.source}{self.SUFFIX}")
+        else:
+            self.path = Path(location) / f"{self.source.name}{self.SUFFIX}"
+
+    @staticmethod
+    def digest(path) -> str:
+        sha = hashlib.sha256()
+        with open(path, "rb") as fh:
+            for block in iter(lambda: fh.read(CHUNK_SIZE), b""):
+                sha.update(block)
+        return sha.hexdigest()
+
+    def _is_current(self, key: dict, version: str) -> bool:
+        stat = os.stat(self.source)
+        if key.get("brendapyrser") != version or key.get("size") != stat.st_size:
+            return False
+        # Size and mtime identify an untouched file without re-reading it; a
+        # touched or copied file is accepted only if its content is unchanged.
+        return key.get("mtime") == stat.st_mtime_ns or key.get("sha256") == self.digest(
+            self.source
+        )
+
+    def load(self, version: str):
+        """Return ``(header, entries)``, or ``None`` if missing or stale."""
+        try:
+            with open(self.path, "rb") as fh:
+                if not self._is_current(pickle.load(fh), version):
+                    return None
+                return pickle.load(fh)
+        except (
+            OSError,
+            EOFError,
+            pickle.UnpicklingError,
+            AttributeError,
+            ImportError,
+        ):
+            return None
+
+    def save(self, version: str, header: dict, entries: list) -> None:
+        """Write the snapshot atomically; a read-only location is not an error."""
+        stat = os.stat(self.source)
+        key = {
+            "brendapyrser": version,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "sha256": self.digest(self.source),
+        }
+        tmp_path = Path(f"{self.path}.tmp")
+        try:
+            with open(tmp_path, "wb") as fh:
+                pickle.dump(key, fh, protocol=5)
+                pickle.dump((header, entries), fh, protocol=5)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+
+class _DecompressedCache:
+    """
+    Uncompressed copy of a compressed BRENDA database on local disk.
+
+    The JSON is extracted once next to the archive (``<file>.json``) or into a
+    given directory, together with a small ``.source`` stamp recording the
+    archive's size and modification time; it is re-extracted when the archive
+    changes.
+    """
+
+    SUFFIX = ".json"
+
+    def __init__(self, source, location=True):
+        self.source = Path(source)
+        if location is True:
+            self.path = Path(f"{self.source}{self.SUFFIX}")
+        else:
+            self.path = Path(location) / f"{self.source.name}{self.SUFFIX}"
+        self.stamp_path = Path(f"{self.path}.source")
+
+    def _stamp(self) -> dict:
+        stat = os.stat(self.source)
+        return {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+    def open(self) -> Path:
+        """Return the path of the uncompressed JSON, extracting it if stale."""
+        stamp = self._stamp()
+        try:
+            with open(self.stamp_path, encoding="utf-8") as fh:
+                if json.load(fh) == stamp and self.path.is_file():
+                    return self.path
+        except (OSError, ValueError):
+            pass
+        tmp_path = Path(f"{self.path}.tmp")
+        try:
+            with _open_database(self.source) as src, open(tmp_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, CHUNK_SIZE)
+            os.replace(tmp_path, self.path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        with open(self.stamp_path, "w", encoding="utf-8") as fh:
+            json.dump(stamp, fh)
+        return self.path
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Typed decoding of BRENDA entries (requires ``msgspec``).
+
+The structs below follow the BRENDA JSON schema
+(https://www.brenda-enzymes.org/schemas/docs/2.0.0): an :class:`Entry` per EC
+number holds its :class:`Protein` and :class:`Reference` objects by id and, for
+every field of ``constants.DATA_FIELDS``, a list of :class:`Record`. msgspec
+decodes JSON straight into them, validating types on the way, and each struct
+stores its fields in a fixed slot layout instead of a per-object dict.
+
+So that the rest of the package can keep treating entries as decoded JSON,
+every struct also reads like a mapping of the fields that are set: ``get``,
+``[]``, ``in``, ``keys``/``values``/``items`` and ``**`` unpacking behave as on
+the corresponding dict. Keys outside the schema are dropped while decoding.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Optional, Union
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+from .constants import DATA_FIELDS
+
+# Major versions of the BRENDA JSON schema the structs below can decode.
+SCHEMA_VERSIONS = ("1", "2")
+
+
+def _require_msgspec():
+    if msgspec is None:
+        raise ImportError(
+            "msgspec is required for typed decoding: "
+            "pip install 'brendapyrser[typed]'"
+        )
+
+
+def check_schema_version(version) -> str:
+    """
+    Raise ``ValueError`` unless ``version`` (the ``version`` of a BRENDA JSON
+    document) has a major version in ``SCHEMA_VERSIONS``.
+    """
+    major = str(version or "").split(".", 1)[0]
+    if major not in SCHEMA_VERSIONS:
+        raise ValueError(
+            f"Unsupported BRENDA JSON schema version {version!r}, "
+            f"expected major version {' or '.join(SCHEMA_VERSIONS)}"
+        )
+    return version
+
+
+class _Fields:
+    """Read-only mapping over the fields of a struct that are not ``None``."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        return (
+            name
+            for name in type(self).__struct_fields__
+            if getattr(self, name) is not None
+        )
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def get(self, key, default=None):
+        if key not in type(self).__struct_fields__:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [getattr(self, name) for name in self]
+
+    def items(self):
+        return [(name, getattr(self, name)) for name in self]
+
+
+if msgspec is not None:
+
+    class _Struct(_Fields, msgspec.Struct, kw_only=True, omit_defaults=True, gc=False):
+        pass
+
+    class Record(_Struct):
+        """One value of a BRENDA data field."""
+
+        value: Optional[str] = None
+        proteins: Optional[list[str]] = None
+        references: Optional[list[str]] = None
+        comment: Optional[str] = None
+
+    class Protein(_Struct):
+        id: Optional[str] = None
+        organism: Optional[str] = None
+        source: Optional[str] = None
+        accessions: Optional[list[str]] = None
+        references: Optional[list[str]] = None
+        comment: Optional[str] = None
+
+    class Reference(_Struct):
+        id: Optional[str] = None
+        title: Optional[str] = None
+        authors: Optional[list[str]] = None
+        journal: Optional[str] = None
+        year: Optional[int] = None
+        vol: Optional[str] = None
+        pages: Optional[str] = None
+        pmid: Optional[int] = None
+
+    Entry = msgspec.defstruct(
+        "Entry",
+        [
+            ("id", Optional[str], None),
+            ("recommended_name", Optional[str], None),
+            ("systematic_name", Optional[str], None),
+            # A plain string in older releases, a list of records otherwise.
+            ("history", Union[str, list[Record], None], None),
+            ("protein", Optional[dict[str, Protein]], None),
+            ("reference", Optional[dict[str, Reference]], None),
+            *(
+                (field, Optional[list[Record]], None)
+                for field in DATA_FIELDS
+                if field != "history"
+            ),
+        ],
+        bases=(_Struct,),
+        module=__name__,
+        kw_only=True,
+        omit_defaults=True,
+        gc=False,
+    )
+    Entry.__doc__ = "The BRENDA entry of one EC number."
+
+    class Header(msgspec.Struct, kw_only=True):
+        release: str = ""
+        version: str = ""
+
+    class Document(Header, kw_only=True, gc=False):
+        data: dict[str, Entry] = {}
+
+    Mapping.register(_Struct)
+
+    _header_decoder = msgspec.json.Decoder(Header)
+    _document_decoder = msgspec.json.Decoder(Document)
+    _entry_decoder = msgspec.json.Decoder(Entry)
+
+
+def decode_document(raw: bytes) -> dict:
+    """
+    Decode a whole BRENDA JSON document into ``{"release", "version", "data"}``,
+    ``data`` mapping EC numbers to :class:`Entry`. The schema version is
+    checked first, skipping over ``data`` without building any object.
+    """
+    _require_msgspec()
+    check_schema_version(_header_decoder.decode(raw).version)
+    document = _document_decoder.decode(raw)
+    return {
+        "release": document.release,
+        "version": document.version,
+        "data": document.data,
+    }
+
+
+def decode_entry(raw: bytes):
+    """Decode the JSON object of a single EC entry into an :class:`Entry`."""
+    _require_msgspec()
+    return _entry_decoder.decode(raw)
+
+
+def to_entry(entry: dict):
+    """Convert an already decoded EC entry into an :class:`Entry`."""
+    _require_msgspec()
+    return msgspec.convert(entry, Entry)
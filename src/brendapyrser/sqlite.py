@@ -0,0 +1,357 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+SQLite copy of the BRENDA database.
+
+:func:`build_database` writes the tables of :mod:`brendapyrser.arrow`
+(``enzymes``, ``proteins``, ``references`` and one per record field of
+``constants.DATA_FIELDS``) into a single SQLite file, list columns being stored
+as JSON text. Every table is indexed on ``ec_number``; proteins are also indexed
+on organism, kinetic tables on their ``{...}`` compound, and the natural
+substrates/products of every enzyme go to a ``reaction_compounds`` table
+indexed on compound. The distinct (lowercased) organism names go to
+``organism_names``, an FTS5 table with the trigram tokenizer, so that substring
+searches on organisms look up trigrams instead of scanning every protein.
+:class:`_Store` answers lookups against such a file opened read-only, so many
+processes can share it.
+
+Build one from the command line with::
+
+    brendapyrser-sqlite brenda_2026_1.json.tar.gz brenda.sqlite
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+
+from .arrow import _ENZYME_COLUMNS, _layout
+from .constants import KINETIC_FIELDS
+from .values import _split_value_unit
+
+FORMAT = 2
+_SQL_TYPES = {"str": "TEXT", "int": "INTEGER", "strs": "TEXT", "ints": "TEXT"}
+
+
+def _stored(columns: list) -> list:
+    """The ``(column, key, type)`` stored in SQLite (derived ones dropped)."""
+    return [column for column in columns if column[1] is not None]
+
+
+def _schema() -> list:
+    statements = [
+        "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)",
+        "CREATE TABLE reaction_compounds (ec_number TEXT, compound TEXT, role TEXT)",
+        "CREATE INDEX reaction_compounds_compound"
+        " ON reaction_compounds (compound, role)",
+        "CREATE VIRTUAL TABLE organism_names USING fts5"
+        "(organism_key, tokenize = 'trigram case_sensitive 1')",
+    ]
+    for name, columns in _layout().items():
+        defs = [f"{column} {_SQL_TYPES[kind]}" for column, _, kind in _stored(columns)]
+        if columns is _ENZYME_COLUMNS:
+            defs = ["position INTEGER PRIMARY KEY", *defs, "name_key TEXT"]
+            statements += [
+                f"CREATE TABLE enzymes ({', '.join(defs)})",
+                "CREATE UNIQUE INDEX enzymes_ec_number ON enzymes (ec_number)",
+                "CREATE INDEX enzymes_name_key ON enzymes (name_key)",
+            ]
+            continue
+        defs = ["ec_number TEXT", *defs]
+        if name == "proteins":
+            defs.append("organism_key TEXT")
+        if name in KINETIC_FIELDS:
+            defs.append("compound TEXT")
+        statements += [
+            f'CREATE TABLE "{name}" ({", ".join(defs)})',
+            f'CREATE INDEX "{name}_ec_number" ON "{name}" (ec_number)',
+        ]
+        if name == "proteins":
+            statements.append(
+                "CREATE INDEX proteins_organism ON proteins (organism_key, ec_number)"
+            )
+        if name in KINETIC_FIELDS:
+            statements.append(f'CREATE INDEX "{name}_compound" ON "{name}" (compound)')
+    return statements
+
+
+def _values(raw: dict, columns: list) -> list:
+    values = []
+    for _, key, kind in columns:
+        value = raw.get(key)
+        if value is not None and kind in ("strs", "ints"):
+            value = json.dumps(value)
+        values.append(value)
+    return values
+
+
+def build_database(reactions, path, header: dict, version: str) -> Path:
+    """
+    Write ``reactions`` to a SQLite file at ``path``. The file is built under a
+    temporary name and moved into place once complete, so an interrupted build
+    never leaves a truncated database behind.
+    """
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    layout = {name: _stored(columns) for name, columns in _layout().items()}
+    inserts = {
+        name: 'INSERT INTO "{}" VALUES ({})'.format(
+            name,
+            ", ".join(
+                "?"
+                * (
+                    len(columns)
+                    + (2 if name in ("enzymes", "proteins") else 1)
+                    + (name in KINETIC_FIELDS)
+                )
+            ),
+        )
+        for name, columns in layout.items()
+    }
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        for statement in _schema():
+            conn.execute(statement)
+        conn.executemany(
+            "INSERT INTO meta VALUES (?, ?)",
+            [
+                ("format", str(FORMAT)),
+                ("brendapyrser", version),
+                ("release", header.get("release", "")),
+                ("version", header.get("version", "")),
+            ],
+        )
+        for position, rxn in enumerate(reactions):
+            entry = rxn._entry()
+            ec_number = entry.get("id", rxn.ec_number)
+            enzyme = {**entry, "id": ec_number}
+            if not isinstance(enzyme.get("history"), str):
+                enzyme.pop("history", None)
+            conn.execute(
+                inserts["enzymes"],
+                [
+                    position,
+                    *_values(enzyme, layout["enzymes"]),
+                    enzyme.get("recommended_name", "").casefold(),
+                ],
+            )
+            conn.executemany(
+                inserts["proteins"],
+                [
+                    [
+                        ec_number,
+                        *_values(protein, layout["proteins"]),
+                        protein.get("organism", "").lower(),
+                    ]
+                    for protein in entry.get("protein", {}).values()
+                ],
+            )
+            conn.executemany(
+                inserts["references"],
+                [
+                    [ec_number, *_values(reference, layout["references"])]
+                    for reference in entry.get("reference", {}).values()
+                ],
+            )
+            for field, columns in layout.items():
+                if field in ("enzymes", "proteins", "references"):
+                    continue
+                records = entry.get(field)
+                if not isinstance(records, list):
+                    continue
+                rows = []
+                for record in records:
+                    if not isinstance(record, Mapping):
+                        continue
+                    row = [ec_number, *_values(record, columns)]
+                    if field in KINETIC_FIELDS:
+                        _, compound = _split_value_unit(record.get("value", ""))
+                        row.append(compound if compound is not None else "")
+                    rows.append(row)
+                conn.executemany(inserts[field], rows)
+            compounds = set()
+            for mets in rxn.substratesAndProducts:
+                compounds.update((c, "substrate") for c in mets["substrates"])
+                compounds.update((c, "product") for c in mets["products"])
+            conn.executemany(
+                "INSERT INTO reaction_compounds VALUES (?, ?, ?)",
+                [(ec_number, compound, role) for compound, role in sorted(compounds)],
+            )
+        conn.execute(
+            "INSERT INTO organism_names SELECT DISTINCT organism_key FROM proteins"
+        )
+        conn.commit()
+    except BaseException:
+        conn.close()
+        tmp.unlink(missing_ok=True)
+        raise
+    conn.close()
+    os.replace(tmp, path)
+    return path
+
+
+class _Store:
+    """
+    Read-only access to a database written by :func:`build_database`. Each
+    thread gets its own connection.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        if not self.path.is_file():
+            raise ValueError(f"{self.path} is not a BRENDA SQLite database")
+        self.__local = threading.local()
+        try:
+            meta = dict(self.__query("SELECT key, value FROM meta"))
+        except sqlite3.DatabaseError:
+            raise ValueError(f"{self.path} is not a BRENDA SQLite database")
+        if meta.get("format") != str(FORMAT):
+            raise ValueError(
+                f"Unsupported BRENDA SQLite database format: {meta.get('format')}"
+            )
+        self.header = {
+            "release": meta.get("release", ""),
+            "version": meta.get("version", ""),
+        }
+        self.layout = {name: _stored(columns) for name, columns in _layout().items()}
+
+    def __connection(self) -> sqlite3.Connection:
+        conn = getattr(self.__local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+            self.__local.conn = conn
+        return conn
+
+    def __query(self, sql: str, params=()) -> list:
+        return self.__connection().execute(sql, params).fetchall()
+
+    def ec_numbers(self) -> list:
+        """EC numbers in database order."""
+        return [
+            row[0]
+            for row in self.__query("SELECT ec_number FROM enzymes ORDER BY position")
+        ]
+
+    def position(self, ec_number: str):
+        rows = self.__query(
+            "SELECT position FROM enzymes WHERE ec_number = ?", (ec_number,)
+        )
+        return rows[0][0] if rows else None
+
+    def position_by_name(self, name: str):
+        rows = self.__query(
+            "SELECT position FROM enzymes WHERE name_key = ?"
+            " ORDER BY position LIMIT 1",
+            (name.casefold(),),
+        )
+        return rows[0][0] if rows else None
+
+    def positions_with_compound(self, compound: str, roles: tuple) -> list:
+        return [
+            row[0]
+            for row in self.__query(
+                "SELECT DISTINCT e.position FROM reaction_compounds AS c"
+                " JOIN enzymes AS e ON e.ec_number = c.ec_number"
+                f" WHERE c.compound = ? AND c.role IN ({', '.join('?' * len(roles))})"
+                " ORDER BY e.position",
+                (compound, *roles),
+            )
+        ]
+
+    def positions_with_organism(self, species: str) -> list:
+        species = species.lower()
+        if len(species) >= 3:
+            # A quoted phrase matches every organism holding it as a substring.
+            match = "o.organism_key MATCH ?"
+            species = '"{}"'.format(species.replace('"', '""'))
+        else:
+            # Too short for a trigram: scan the (small) table of names.
+            match = "instr(o.organism_key, ?) > 0"
+        return [
+            row[0]
+            for row in self.__query(
+                "SELECT DISTINCT e.position FROM organism_names AS o"
+                " JOIN proteins AS p ON p.organism_key = o.organism_key"
+                " JOIN enzymes AS e ON e.ec_number = p.ec_number"
+                f" WHERE {match} ORDER BY e.position",
+                (species,),
+            )
+        ]
+
+    def organisms(self) -> list:
+        return [
+            row[0]
+            for row in self.__query(
+                "SELECT DISTINCT organism FROM proteins WHERE organism IS NOT NULL"
+            )
+        ]
+
+    def compounds(self, field: str) -> list:
+        """Distinct ``{...}`` compounds of kinetic ``field``, except ``more``."""
+        return [
+            row[0]
+            for row in self.__query(
+                f"SELECT DISTINCT compound FROM \"{field}\" WHERE compound != 'more'"
+            )
+        ]
+
+    def __records(self, name: str, ec_number: str) -> list:
+        columns = self.layout[name]
+        names = ", ".join(column for column, _, _ in columns)
+        records = []
+        for row in self.__query(
+            f'SELECT {names} FROM "{name}" WHERE ec_number = ? ORDER BY rowid',
+            (ec_number,),
+        ):
+            records.append(
+                {
+                    key: json.loads(value) if kind in ("strs", "ints") else value
+                    for (_, key, kind), value in zip(columns, row)
+                    if value is not None
+                }
+            )
+        return records
+
+    def load(self, ec_number: str) -> dict:
+        """Raw BRENDA entry of ``ec_number``, as in the JSON document."""
+        entry = {}
+        for record in self.__records("enzymes", ec_number):
+            entry.update(record)
+        entry["id"] = ec_number
+        proteins = self.__records("proteins", ec_number)
+        if proteins:
+            entry["protein"] = {protein["id"]: protein for protein in proteins}
+        references = self.__records("references", ec_number)
+        if references:
+            entry["reference"] = {
+                reference["id"]: reference for reference in references
+            }
+        for field in self.layout:
+            if field in ("enzymes", "proteins", "references"):
+                continue
+            records = self.__records(field, ec_number)
+            if records:
+                entry[field] = records
+        return entry
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Build a SQLite copy of the BRENDA JSON database."
+    )
+    parser.add_argument("database", help="BRENDA JSON file (.json, .gz, .tar.gz)")
+    parser.add_argument("output", help="SQLite file to write")
+    args = parser.parse_args(argv)
+
+    from .parser import BRENDA
+
+    BRENDA(args.database, streaming=True).to_sqlite(args.output)
@@ -6,14 +6,34 @@ Unit tests for brendapyrser (BRENDA 2026 JSON format).
 """
 
 import gzip
+import io
 import json
 import os
+import pickle
+import re
 import shutil
+import sqlite3
 import tarfile
 import tempfile
+import threading
+import time
 import unittest
+from unittest import mock
 
 from brendapyrser import BRENDA, Reaction
+from brendapyrser.constants import DATA_FIELDS
+from brendapyrser.reader import DECODERS, _EntryIndex, _get_decoder, _iter_database
+from brendapyrser.values import parse_values
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "brenda_sample.json")
 
@@ -273,6 +293,482 @@ class TestLoaders(unittest.TestCase):
                 tar.add(FIXTURE, arcname="brenda_sample.json")
             self._assert_loads(tar_path)
 
+    def _tar(self, tmp, *members):
+        tar_path = os.path.join(tmp, "brenda_sample.json.tar.gz")
+        with tarfile.open(tar_path, "w:gz") as tar:
+            for arcname, path in members:
+                tar.add(path, arcname=arcname)
+        return tar_path
+
+    def test_tar_member_found_by_streaming(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            readme = os.path.join(tmp, "README")
+            with open(readme, "w") as fh:
+                fh.write("BRENDA")
+            tar_path = self._tar(
+                tmp, ("README", readme), ("brenda_sample.json", FIXTURE)
+            )
+            self._assert_loads(tar_path)
+            with mock.patch("brendapyrser.reader._threaded_gzip", None):
+                self._assert_loads(tar_path)
+
+    def test_tar_with_several_json_members(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tar_path = self._tar(tmp, ("a.json", FIXTURE), ("b.json", FIXTURE))
+            with self.assertRaises(ValueError):
+                BRENDA(tar_path)
+            empty = self._tar(tmp)
+            with self.assertRaises(ValueError):
+                BRENDA(empty)
+
+    def test_json_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tar_path = self._tar(tmp, ("brenda_sample.json", FIXTURE))
+            cache_dir = os.path.join(tmp, "cache")
+            os.mkdir(cache_dir)
+            db = BRENDA(tar_path, json_cache=cache_dir, lazy=True)
+            self.assertEqual(
+                db.reactions.get_by_id("1.1.1.304").name,
+                "diacetyl reductase [(S)-acetoin forming]",
+            )
+            cached = os.path.join(cache_dir, "brenda_sample.json.tar.gz.json")
+            with open(cached, "rb") as fh, open(FIXTURE, "rb") as src:
+                self.assertEqual(fh.read(), src.read())
+            with mock.patch("brendapyrser.reader.shutil.copyfileobj") as copy:
+                db = BRENDA(tar_path, json_cache=cache_dir)
+            copy.assert_not_called()
+            self.assertEqual(len(db.reactions), 2)
+
+            with open(FIXTURE, encoding="utf-8") as fh:
+                document = json.load(fh)
+            del document["data"]["6.6.99.99"]
+            changed = os.path.join(tmp, "changed.json")
+            with open(changed, "w", encoding="utf-8") as fh:
+                json.dump(document, fh)
+            os.remove(tar_path)
+            self._tar(tmp, ("brenda_sample.json", changed))
+            db = BRENDA(tar_path, json_cache=cache_dir)
+            self.assertEqual([r.ec_number for r in db.reactions], ["1.1.1.304"])
+
+    def test_progress(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tar_path = self._tar(tmp, ("brenda_sample.json", FIXTURE))
+            for path, streaming, total_entries in [
+                (FIXTURE, False, 2),
+                (FIXTURE, True, None),
+                (tar_path, False, 2),
+            ]:
+                calls = []
+                BRENDA(path, streaming=streaming, progress=lambda *a: calls.append(a))
+                bytes_read, total_bytes, entries, total = calls[-1]
+                self.assertEqual(bytes_read, os.path.getsize(path))
+                self.assertEqual(total_bytes, os.path.getsize(path))
+                self.assertEqual((entries, total), (2, total_entries))
+                self.assertEqual([c[0] for c in calls], sorted(c[0] for c in calls))
+
+    def test_decoders(self):
+        with open(FIXTURE) as fh:
+            expected = json.load(fh)
+        for name in DECODERS:
+            with open(FIXTURE, "rb") as fh:
+                self.assertEqual(_get_decoder(name)(fh.read()), expected)
+            db = BRENDA(FIXTURE, decoder=name)
+            self.assertEqual(len(db.reactions), 2)
+            with tempfile.TemporaryDirectory() as tmp:
+                # Lazy mode writes its index next to the database.
+                path = os.path.join(tmp, "brenda_sample.json")
+                shutil.copyfile(FIXTURE, path)
+                lazy = BRENDA(path, lazy=True, decoder=name)
+                self.assertEqual(
+                    lazy.reactions.get_by_id("1.1.1.304").name,
+                    db.reactions.get_by_id("1.1.1.304").name,
+                )
+        with mock.patch("brendapyrser.reader.orjson", None):
+            self.assertIs(_get_decoder("orjson"), json.loads)
+        with self.assertRaises(ValueError):
+            BRENDA(FIXTURE, decoder="ujson")
+
+
+class TestStreamingLoader(unittest.TestCase):
+    """The streaming loader must yield the same database as json.load."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = BRENDA(FIXTURE)
+
+    def _assert_same(self, db):
+        self.assertEqual(db.release, self.db.release)
+        self.assertEqual(db.schema_version, self.db.schema_version)
+        self.assertEqual(
+            [r.ec_number for r in db.reactions],
+            [r.ec_number for r in self.db.reactions],
+        )
+        rxn = db.reactions.get_by_id("1.1.1.304")
+        self.assertEqual(
+            rxn.KMvalues, self.db.reactions.get_by_id("1.1.1.304").KMvalues
+        )
+
+    def test_plain_json(self):
+        self._assert_same(BRENDA(FIXTURE, streaming=True))
+
+    def test_gzip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            gz_path = os.path.join(tmp, "brenda_sample.json.gz")
+            with open(FIXTURE, "rb") as src, gzip.open(gz_path, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            self._assert_same(BRENDA(gz_path, streaming=True))
+
+    def test_tar_gz(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tar_path = os.path.join(tmp, "brenda_sample.json.tar.gz")
+            with tarfile.open(tar_path, "w:gz") as tar:
+                tar.add(FIXTURE, arcname="brenda_sample.json")
+            self._assert_same(BRENDA(tar_path, streaming=True))
+
+    def test_tiny_chunks_split_values_and_utf8(self):
+        # Chunk boundaries fall inside strings, numbers and multi-byte chars.
+        document = {
+            "data": {"1.1.1.1": {"id": "1.1.1.1", "comment": "µmol ±5 °C"}},
+            "release": "2026.1",
+            "version": 12345,
+        }
+        raw = json.dumps(document, ensure_ascii=False, indent=1).encode("utf-8")
+        header = {}
+        entries = list(_iter_database(io.BytesIO(raw), header, chunk_size=3))
+        self.assertEqual(entries, list(document["data"].items()))
+        self.assertEqual(header, {"release": "2026.1", "version": 12345})
+
+    def test_malformed_document_raises(self):
+        with self.assertRaises(ValueError):
+            list(_iter_database(io.BytesIO(b'{"data": {"1.1.1.1": {"id"'), {}))
+
+
+class TestLazyLoader(unittest.TestCase):
+    """Lazy mode decodes single entries through a persisted byte-offset index."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "brenda_sample.json")
+        shutil.copyfile(FIXTURE, self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_matches_eager_load(self):
+        eager = BRENDA(FIXTURE)
+        lazy = BRENDA(self.path, lazy=True)
+        self.assertEqual(lazy.release, eager.release)
+        self.assertEqual(lazy.schema_version, eager.schema_version)
+        self.assertEqual(
+            [r.ec_number for r in lazy.reactions],
+            [r.ec_number for r in eager.reactions],
+        )
+        for ec in ("1.1.1.304", "6.6.99.99"):
+            lazy_rxn = lazy.reactions.get_by_id(ec)
+            eager_rxn = eager.reactions.get_by_id(ec)
+            self.assertEqual(lazy_rxn.name, eager_rxn.name)
+            self.assertEqual(lazy_rxn.KMvalues, eager_rxn.KMvalues)
+            self.assertEqual(lazy_rxn.references, eager_rxn.references)
+
+    def test_index_spans_decode_entries(self):
+        with open(self.path, "rb") as fh:
+            raw = fh.read()
+        data = json.loads(raw)["data"]
+        index = _EntryIndex.open(self.path)
+        self.assertEqual(list(index), list(data))
+        for ec, (offset, length) in index.spans.items():
+            self.assertEqual(json.loads(raw[offset : offset + length]), data[ec])
+
+    def test_index_is_persisted_and_refreshed(self):
+        BRENDA(self.path, lazy=True)
+        index_path = _EntryIndex.index_path(self.path)
+        self.assertTrue(os.path.exists(index_path))
+        with open(self.path, encoding="utf-8") as fh:
+            document = json.load(fh)
+        del document["data"]["6.6.99.99"]
+        with open(self.path, "w", encoding="utf-8") as fh:
+            json.dump(document, fh, ensure_ascii=False)
+        db = BRENDA(self.path, lazy=True)
+        self.assertEqual([r.ec_number for r in db.reactions], ["1.1.1.304"])
+
+    def test_non_ascii_offsets(self):
+        document = {
+            "release": "2026.1",
+            "data": {
+                "1.1.1.1": {"id": "1.1.1.1", "recommended_name": "µ-°-±"},
+                "1.1.1.2": {"id": "1.1.1.2", "recommended_name": "after"},
+            },
+        }
+        with open(self.path, "w", encoding="utf-8") as fh:
+            json.dump(document, fh, ensure_ascii=False)
+        db = BRENDA(self.path, lazy=True)
+        self.assertEqual(db.reactions.get_by_id("1.1.1.2").name, "after")
+        self.assertEqual(db.reactions.get_by_id("1.1.1.1").name, "µ-°-±")
+
+    def test_compressed_input_rejected(self):
+        with self.assertRaises(ValueError):
+            BRENDA(self.path + ".gz", lazy=True)
+
+    def test_deferred_load_is_thread_safe(self):
+        entry = BRENDA(FIXTURE).reactions.get_by_id("1.1.1.304")._entry()
+        calls = []
+
+        def load():
+            calls.append(1)
+            time.sleep(0.05)
+            return entry
+
+        rxn = Reaction._deferred("1.1.1.304", load)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(rxn.KMvalues))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(result == results[0] for result in results))
+
+    def test_failed_deferred_load_is_retried(self):
+        entry = BRENDA(FIXTURE).reactions.get_by_id("1.1.1.304")._entry()
+        outcomes = [OSError("unavailable"), entry]
+
+        def load():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        rxn = Reaction._deferred("1.1.1.304", load)
+        with self.assertRaises(OSError):
+            rxn.name
+        self.assertFalse(rxn._is_loaded())
+        self.assertEqual(rxn.name, entry["recommended_name"])
+        self.assertTrue(rxn._is_loaded())
+        with self.assertRaises(AttributeError):
+            rxn.missing
+
+
+class TestFieldProjection(unittest.TestCase):
+    """Loading only some fields skips the others while streaming."""
+
+    KEEP = {"id", "recommended_name", "systematic_name", "protein", "reference"}
+
+    def setUp(self):
+        with open(FIXTURE, encoding="utf-8") as fh:
+            self.data = json.load(fh)["data"]
+
+    def expected(self, *fields):
+        keep = self.KEEP.union(fields)
+        return {
+            ec: {k: v for k, v in entry.items() if k in keep}
+            for ec, entry in self.data.items()
+        }
+
+    def test_only_requested_fields_loaded(self):
+        db = BRENDA(FIXTURE, fields=["km_value", "turnover_number"])
+        expected = self.expected("km_value", "turnover_number")
+        for rxn in db.reactions:
+            self.assertEqual(rxn._entry(), expected[rxn.ec_number])
+        rxn = db.reactions.get_by_id("1.1.1.304")
+        self.assertEqual(rxn.KMvalues, BRENDA(FIXTURE).reactions[0].KMvalues)
+        self.assertEqual(rxn.field("cloned"), [])
+
+    def test_skipping_across_chunk_boundaries(self):
+        document = {
+            "release": "2026.1",
+            "data": {
+                "1.1.1.1": {
+                    "id": "1.1.1.1",
+                    "cloned": [{"comment": 'tricky "}]\\ {[', "value": "x"}],
+                    "km_value": [{"value": "1 {A}", "proteins": []}],
+                }
+            },
+        }
+        raw = json.dumps(document).encode("utf-8")
+        expected = [
+            (
+                "1.1.1.1",
+                {"id": "1.1.1.1", "km_value": [{"value": "1 {A}", "proteins": []}]},
+            )
+        ]
+        for chunk_size in (1, 2, 3, 5, 8, 13):
+            header = {}
+            entries = list(
+                _iter_database(
+                    io.BytesIO(raw), header, chunk_size, fields={"id", "km_value"}
+                )
+            )
+            self.assertEqual(entries, expected, chunk_size)
+            self.assertEqual(header, {"release": "2026.1"})
+
+    def test_lazy_and_snapshot_projection(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "brenda_sample.json")
+            shutil.copyfile(FIXTURE, path)
+            expected = self.expected("ph_optimum")
+            for options in ({"lazy": True}, {"snapshot": True}, {"snapshot": True}):
+                db = BRENDA(path, fields=["ph_optimum"], **options)
+                for rxn in db.reactions:
+                    self.assertEqual(rxn._entry(), expected[rxn.ec_number])
+            self.assertIn("km_value", BRENDA(path, snapshot=True).reactions[0]._entry())
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            BRENDA(FIXTURE, fields=["km_values"])
+
+
+@unittest.skipIf(msgspec is None, "msgspec is not installed")
+class TestTypedDecoding(unittest.TestCase):
+    """typed=True must decode into schema structs that behave like the dicts."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = BRENDA(FIXTURE)
+
+    def setUp(self):
+        # Lazy mode writes its index next to the database.
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "brenda_sample.json")
+        shutil.copyfile(FIXTURE, self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _assert_same(self, db):
+        from brendapyrser.schema import Entry
+
+        for rxn, expected in zip(db.reactions, self.db.reactions):
+            self.assertIsInstance(rxn._entry(), Entry)
+            self.assertEqual(rxn.KMvalues, expected.KMvalues)
+            self.assertEqual(rxn.proteins, expected.proteins)
+            self.assertEqual(rxn.references, expected.references)
+            self.assertEqual(rxn.bibliography, expected.bibliography)
+            self.assertEqual(rxn.substratesAndProducts, expected.substratesAndProducts)
+
+    def test_loading_modes(self):
+        self._assert_same(BRENDA(FIXTURE, typed=True))
+        self._assert_same(BRENDA(FIXTURE, typed=True, streaming=True))
+        self._assert_same(BRENDA(self.path, typed=True, lazy=True))
+        self._assert_same(BRENDA(FIXTURE, typed=True, compact=True))
+
+    def test_fields(self):
+        for lazy in (False, True):
+            db = BRENDA(self.path, typed=True, lazy=lazy, fields=["km_value"])
+            rxn = db.reactions.get_by_id("1.1.1.304")
+            self.assertIsNone(rxn._entry().ki_value)
+            self.assertEqual(
+                rxn.KMvalues, self.db.reactions.get_by_id("1.1.1.304").KMvalues
+            )
+
+    def test_snapshot_holds_dicts(self):
+        self._assert_same(BRENDA(self.path, typed=True, snapshot=True))
+        with open(self.path + ".snapshot", "rb") as fh:
+            pickle.load(fh)
+            _, entries = pickle.load(fh)
+        self.assertTrue(all(type(entry) is dict for _, entry in entries))
+        rxn = BRENDA(self.path, snapshot=True).reactions.get_by_id("1.1.1.304")
+        self.assertIs(type(rxn._entry()), dict)
+        self._assert_same(BRENDA(self.path, typed=True, snapshot=True))
+
+    def test_entries_read_like_dicts(self):
+        entry = BRENDA(FIXTURE, typed=True).reactions.get_by_id("1.1.1.304")._entry()
+        with open(FIXTURE, encoding="utf-8") as fh:
+            raw = json.load(fh)["data"]["1.1.1.304"]
+        self.assertEqual(set(entry), set(raw))
+        self.assertEqual(entry["km_value"][0]["value"], raw["km_value"][0]["value"])
+        self.assertEqual(entry.get("ic50_value", []), [])
+        self.assertNotIn("ic50_value", entry)
+        with self.assertRaises(KeyError):
+            entry["ic50_value"]
+
+    def test_schema_version(self):
+        with open(FIXTURE, encoding="utf-8") as fh:
+            document = json.load(fh)
+        document["version"] = "3.0.0"
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "brenda.json")
+            with open(path, "w", encoding="utf-8") as fh:
+                json.dump(document, fh)
+            self.assertEqual(len(BRENDA(path).reactions), 2)
+            for streaming in (False, True):
+                with self.assertRaises(ValueError):
+                    BRENDA(path, typed=True, streaming=streaming)
+
+
+class TestSnapshot(unittest.TestCase):
+    """Parsed databases are cached in a binary snapshot keyed by the source."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "brenda_sample.json")
+        shutil.copyfile(FIXTURE, self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _load_without_parsing(self, **kwargs):
+        with mock.patch(
+            "brendapyrser.parser._load_database", side_effect=AssertionError
+        ):
+            return BRENDA(self.path, snapshot=True, **kwargs)
+
+    def test_snapshot_written_and_reused(self):
+        first = BRENDA(self.path, snapshot=True)
+        self.assertTrue(os.path.exists(self.path + ".snapshot"))
+        second = self._load_without_parsing()
+        self.assertEqual(second.release, first.release)
+        self.assertEqual(
+            second.reactions.get_by_id("1.1.1.304").KMvalues,
+            first.reactions.get_by_id("1.1.1.304").KMvalues,
+        )
+
+    def test_touched_file_with_same_content_is_reused(self):
+        BRENDA(self.path, snapshot=True)
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(len(self._load_without_parsing().reactions), 2)
+
+    def test_changed_content_invalidates(self):
+        BRENDA(self.path, snapshot=True)
+        with open(self.path, encoding="utf-8") as fh:
+            document = json.load(fh)
+        document["release"] = "2026.2"
+        with open(self.path, "w", encoding="utf-8") as fh:
+            json.dump(document, fh, ensure_ascii=False)
+        self.assertEqual(BRENDA(self.path, snapshot=True).release, "2026.2")
+
+    def test_other_version_invalidates(self):
+        BRENDA(self.path, snapshot=True)
+        with mock.patch("brendapyrser.parser.__version__", "0.0.0-other"):
+            with self.assertRaises(AssertionError):
+                self._load_without_parsing()
+
+    def test_unimportable_snapshot_is_rebuilt(self):
+        BRENDA(self.path, snapshot=True)
+        with open(self.path + ".snapshot", "rb") as fh:
+            pickle.load(fh)
+            key_size = fh.tell()
+            fh.seek(0)
+            key = fh.read(key_size)
+        with open(self.path + ".snapshot", "wb") as fh:
+            # A payload referring to a class whose module cannot be imported.
+            fh.write(key + b"cbrendapyrser_missing_module\nEntry\n.")
+        self.assertEqual(len(BRENDA(self.path, snapshot=True).reactions), 2)
+        self.assertEqual(len(self._load_without_parsing().reactions), 2)
+
+    def test_snapshot_directory_and_streaming(self):
+        cache_dir = os.path.join(self.tmp.name, "cache")
+        os.mkdir(cache_dir)
+        db = BRENDA(self.path, streaming=True, snapshot=cache_dir)
+        self.assertEqual(db.release, "2026.1")
+        self.assertTrue(
+            os.path.exists(os.path.join(cache_dir, "brenda_sample.json.snapshot"))
+        )
+
 
 class TestBRENDAExtras(unittest.TestCase):
     """Database-level accessors not covered by TestBRENDA."""
@@ -333,6 +829,100 @@ class TestReactionList(unittest.TestCase):
             self.db.reactions.filter_by_organism("Staphylococcus"), ReactionList
         )
 
+    def test_reactions_copy_shares_indexes(self):
+        db = BRENDA(FIXTURE)
+        first, second = db.reactions, db.reactions
+        self.assertIsNot(first, second)
+        first.get_by_id("1.1.1.304")
+        first.filter_by_organism("Staphylococcus")
+        self.assertIs(second._ec_index(), first._ec_index())
+        self.assertIs(second._organism_index(), first._organism_index())
+
+    def test_modifying_reactions_leaves_database_untouched(self):
+        db = BRENDA(FIXTURE)
+        reactions = db.reactions
+        reactions.get_by_id("6.6.99.99")
+        removed = reactions.pop()
+        self.assertEqual(len(reactions), 1)
+        with self.assertRaises(ValueError):
+            reactions.get_by_id(removed.ec_number)
+        self.assertEqual(len(db.reactions), 2)
+        self.assertIs(db.reactions.get_by_id(removed.ec_number), removed)
+
+    def test_get_many_preserves_order(self):
+        hits = self.db.reactions.get_many(["6.6.99.99", "1.1.1.304"])
+        self.assertEqual([r.ec_number for r in hits], ["6.6.99.99", "1.1.1.304"])
+
+    def test_get_many_missing_raises(self):
+        with self.assertRaises(ValueError):
+            self.db.reactions.get_many(["1.1.1.304", "9.9.9.9"])
+
+    def test_lookups_on_slices(self):
+        head = self.db.reactions[:1]
+        self.assertEqual(head.get_by_id("1.1.1.304").ec_number, "1.1.1.304")
+        with self.assertRaises(ValueError):
+            head.get_by_id("6.6.99.99")
+
+    def test_indexes_follow_mutation(self):
+        from brendapyrser.parser import ReactionList
+
+        rl = ReactionList(self.db.reactions[:1])
+        with self.assertRaises(ValueError):
+            rl.get_by_id("6.6.99.99")
+        rl.append(self.db.reactions.get_by_id("6.6.99.99"))
+        self.assertEqual(rl.get_by_id("6.6.99.99").ec_number, "6.6.99.99")
+        del rl[0]
+        with self.assertRaises(ValueError):
+            rl.get_by_name("diacetyl reductase [(S)-acetoin forming]")
+
+    def test_compound_filters_match_scan(self):
+        reactions = self.db.reactions
+        compounds = {
+            c
+            for rxn in reactions
+            for mets in rxn.substratesAndProducts
+            for c in mets["substrates"] + mets["products"]
+        }
+        self.assertTrue(compounds)
+        for c in compounds:
+            pairs = [(r, r.substratesAndProducts) for r in reactions]
+            self.assertEqual(
+                reactions.filter_by_substrate(c),
+                [r for r, sp in pairs if any(c in m["substrates"] for m in sp)],
+            )
+            self.assertEqual(
+                reactions.filter_by_product(c),
+                [r for r, sp in pairs if any(c in m["products"] for m in sp)],
+            )
+            self.assertEqual(
+                reactions.filter_by_compound(c),
+                [
+                    r
+                    for r, sp in pairs
+                    if any(c in m["substrates"] + m["products"] for m in sp)
+                ],
+            )
+
+    def test_organism_filter_matches_scan(self):
+        reactions = self.db.reactions
+        for query in ("Staphylococcus", "coccus AUR", "rhodo", "co", "a", "", "xyz"):
+            expected = [
+                r
+                for r in reactions
+                if any(query.lower() in o.lower() for o in r.organisms)
+            ]
+            self.assertEqual(reactions.filter_by_organism(query), expected, query)
+
+    def test_compound_index_follows_mutation(self):
+        from brendapyrser.parser import ReactionList
+
+        rl = ReactionList(self.db.reactions[1:])
+        self.assertEqual(rl.filter_by_substrate("NADH"), [])
+        rl.insert(0, self.db.reactions.get_by_id("1.1.1.304"))
+        self.assertEqual(
+            [r.ec_number for r in rl.filter_by_substrate("NADH")], ["1.1.1.304"]
+        )
+
 
 class TestReactionProperties(unittest.TestCase):
     """Reaction properties beyond the core kinetics already covered."""
@@ -435,6 +1025,243 @@ class TestPropertyDicts(unittest.TestCase):
         )
 
 
+class TestViewCache(unittest.TestCase):
+    """Derived Reaction views are memoised and handed out as copies."""
+
+    def setUp(self):
+        with open(FIXTURE, encoding="utf-8") as fh:
+            self.entry = json.load(fh)["data"]["1.1.1.304"]
+        self.rxn = Reaction(self.entry)
+
+    def test_views_are_built_once(self):
+        with mock.patch.object(
+            Reaction,
+            "_Reaction__getDictOfEnzymeProperties",
+            autospec=True,
+            side_effect=Reaction._Reaction__getDictOfEnzymeProperties,
+        ) as build:
+            first = self.rxn.KMvalues
+            second = self.rxn.KMvalues
+        self.assertEqual(build.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    def test_callers_cannot_corrupt_cache(self):
+        km = self.rxn.KMvalues
+        km["NADH"][0]["value"] = -1
+        km["NADH"][0]["species"].append("Mutant")
+        del km["NADH"]
+        self.rxn.temperature["optimum"].clear()
+        self.rxn.field("cloned").clear()
+        fresh = Reaction(self.entry)
+        self.assertEqual(self.rxn.KMvalues, fresh.KMvalues)
+        self.assertEqual(self.rxn.temperature, fresh.temperature)
+        self.assertEqual(self.rxn.field("cloned"), fresh.field("cloned"))
+
+    def test_property_types_preserved(self):
+        from brendapyrser.parser import EnzymeConditionDict, EnzymePropertyDict
+
+        self.rxn.KMvalues
+        self.assertIsInstance(self.rxn.KMvalues, EnzymePropertyDict)
+        self.rxn.PH
+        self.assertIsInstance(self.rxn.PH, EnzymeConditionDict)
+
+    def test_citations_formatted_once_per_reference(self):
+        with mock.patch.object(
+            Reaction,
+            "_Reaction__format_citation",
+            side_effect=Reaction._Reaction__format_citation,
+        ) as fmt:
+            self.rxn.KMvalues
+            self.rxn.Kcatvalues
+            self.rxn.field("cloned")
+            self.rxn.substrates_products
+            references = self.rxn.references
+        self.assertEqual(fmt.call_count, len(self.entry["reference"]))
+        self.assertEqual(references, Reaction(self.entry).references)
+
+    def test_cache_can_be_disabled_and_bounded(self):
+        with mock.patch.object(Reaction, "cache_views", False):
+            self.rxn.KMvalues
+            self.assertEqual(self.rxn._Reaction__views, {})
+        with mock.patch.object(Reaction, "max_cached_views", 2):
+            self.rxn.KMvalues
+            self.rxn.PH
+            self.rxn.KMvalues
+            self.rxn.organisms
+            self.assertEqual(list(self.rxn._Reaction__views), ["KMvalues", "organisms"])
+        self.rxn.clear_cache()
+        self.assertEqual(self.rxn._Reaction__views, {})
+
+
+class TestCompactMemory(unittest.TestCase):
+    """Slotted reactions, string interning and field dropping."""
+
+    def test_reactions_have_no_instance_dict(self):
+        rxn = BRENDA(FIXTURE).reactions[0]
+        self.assertFalse(hasattr(rxn, "__dict__"))
+        with self.assertRaises(AttributeError):
+            rxn.not_an_attribute
+
+    def test_compact_memory_reports_savings(self):
+        db = BRENDA(FIXTURE)
+        rxn = db.reactions.get_by_id("1.1.1.304")
+        km, refs = rxn.KMvalues, rxn.references
+        report = db.compact_memory()
+        self.assertGreater(report["bytes_saved"], 0)
+        self.assertEqual(
+            report["bytes_before"] - report["bytes_after"], report["bytes_saved"]
+        )
+        self.assertEqual(rxn.KMvalues, km)
+        self.assertEqual(rxn.references, refs)
+        records = rxn._entry()["km_value"]
+        comments = [
+            r["comment"] for r in records if r["comment"] == records[0]["comment"]
+        ]
+        self.assertTrue(all(c is comments[0] for c in comments))
+
+    def test_drop_fields(self):
+        db = BRENDA(FIXTURE)
+        rxn = db.reactions.get_by_id("1.1.1.304")
+        self.assertTrue(rxn.field("purification"))
+        db.compact_memory(drop_fields=["purification", "cloned"])
+        self.assertEqual(rxn.field("purification"), [])
+        self.assertTrue(rxn.KMvalues)
+        with self.assertRaises(ValueError):
+            db.compact_memory(drop_fields=["not_a_field"])
+
+    def test_compact_load_interns_strings(self):
+        db = BRENDA(FIXTURE, compact=True)
+        entry = db.reactions.get_by_id("1.1.1.304")._entry()
+        organisms = {}
+        for protein in entry["protein"].values():
+            organism = organisms.setdefault(protein["organism"], protein["organism"])
+            self.assertIs(protein["organism"], organism)
+        self.assertLess(len(organisms), len(entry["protein"]))
+        self.assertEqual(db.compact_memory()["bytes_saved"], 0)
+
+
+class TestValueTable(unittest.TestCase):
+    """Database-wide columnar table of numeric records."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = BRENDA(FIXTURE)
+        cls.rxn = cls.db.reactions.get_by_id("1.1.1.304")
+        cls.table = cls.db.value_table()
+
+    def test_table_is_cached(self):
+        self.assertIs(self.db.value_table(), self.table)
+
+    def test_single_field_name(self):
+        table = self.db.value_table("km_value")
+        self.assertEqual(list(table.fields), ["km_value"])
+        self.assertIs(self.db.value_table(["km_value"]), table)
+        self.assertEqual(len(table.value), self.table.field_mask("km_value").sum())
+
+    def test_km_rows_match_property(self):
+        mask = self.table.field_mask("km_value")
+        self.assertEqual(
+            sorted(self.table.value[mask].tolist()),
+            sorted(self.rxn.KMvalues.get_values()),
+        )
+        self.assertEqual(self.table.field_mask("no_such_field").sum(), 0)
+
+    def test_compound_mask(self):
+        mask = self.table.field_mask("km_value") & self.table.compound_mask("NADH")
+        expected = [rec["value"] for rec in self.rxn.KMvalues["NADH"]]
+        self.assertEqual(self.table.value[mask].tolist(), expected)
+
+    def test_organism_mask_matches_records(self):
+        mask = self.table.field_mask("turnover_number") & self.table.organism_mask(
+            "staphylococcus"
+        )
+        expected = [
+            rec["value"]
+            for recs in self.rxn.Kcatvalues.values()
+            for rec in recs
+            if any("staphylococcus" in s.lower() for s in rec["species"])
+        ]
+        self.assertEqual(sorted(self.table.value[mask].tolist()), sorted(expected))
+
+    def test_offsets_resolve_organisms_and_references(self):
+        first = next(iter(self.rxn.KMvalues.values()))[0]
+        start, stop = self.table.organism_offsets[:2]
+        organisms = [
+            self.table.organisms[c] for c in self.table.organism_codes[start:stop]
+        ]
+        self.assertEqual(sorted(organisms), sorted(first["species"]))
+        start, stop = self.table.reference_offsets[:2]
+        self.assertEqual(len(first["refs"]), stop - start)
+
+    def test_ranges_and_invalid_values(self):
+        rxn = Reaction(
+            {
+                "id": "9.9.9.9",
+                "temperature_range": [
+                    {"value": "20-40", "proteins": [], "references": []},
+                    {"value": "oops", "proteins": [], "references": []},
+                ],
+            }
+        )
+        from brendapyrser import ValueTable
+
+        table = ValueTable.from_reactions([rxn], ["temperature_range"])
+        self.assertEqual(table.low[0], 20.0)
+        self.assertEqual(table.high[0], 40.0)
+        self.assertEqual(table.value[0], 30.0)
+        self.assertEqual(table.valid_mask().tolist(), [True, False])
+
+
+class TestToFrame(unittest.TestCase):
+    """Long-format DataFrames of any data field."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = BRENDA(FIXTURE)
+        cls.rxn = cls.db.reactions.get_by_id("1.1.1.304")
+
+    def test_km_frame_matches_property(self):
+        frame = self.db.reactions.to_frame("km_value")
+        records = [
+            r for r in self.rxn.field("km_value") if not r["value"].endswith("{more}")
+        ]
+        self.assertEqual(len(frame), sum(len(r["organisms"]) for r in records))
+        nadh = frame[frame["compound"] == "NADH"].drop_duplicates(
+            ["text", "comment", "organism"]
+        )
+        self.assertEqual(
+            sorted(nadh["value"].tolist()),
+            sorted(rec["value"] for rec in self.rxn.KMvalues["NADH"]),
+        )
+        self.assertEqual(str(frame["organism"].dtype), "category")
+        self.assertEqual(str(frame["value"].dtype), "float64")
+
+    def test_more_placeholders_dropped(self):
+        # 1.1.1.304 has a "-999 {more}" Km record, which KMvalues leaves out.
+        frame = self.db.reactions.to_frame("km_value")
+        self.assertNotIn("more", set(frame["compound"]))
+        self.assertFalse((frame["value"] == -999).any())
+        table = self.db.value_table("km_value")
+        self.assertEqual(
+            set(frame["value"].dropna()), set(table.value[table.valid_mask()])
+        )
+
+    def test_ranges_and_text_fields(self):
+        ph = self.db.reactions.to_frame("ph_range")
+        row = ph[ph["text"] == "5-8"].iloc[0]
+        self.assertEqual((row["low"], row["value"], row["high"]), (5.0, 6.5, 8.0))
+        cofactors = self.db.reactions.to_frame("cofactor")
+        self.assertIn("NADH", set(cofactors["text"]))
+        self.assertTrue(cofactors["value"].isna().all())
+        self.assertEqual(set(cofactors["compound"]), {""})
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            self.db.reactions.to_frame("not_a_field")
+        self.assertEqual(len(self.db.reactions.to_frame("history")), 0)
+
+
 class TestRangeEvaluation(unittest.TestCase):
     """Numeric/range coercion via constructed entries (deterministic)."""
 
@@ -473,6 +1300,304 @@ class TestRangeEvaluation(unittest.TestCase):
         )
         self.assertEqual(rxn.PH["range"][0]["value"], [-999, -999])
 
+    # The per-record parsers that batch parsing replaced.
+    @staticmethod
+    def _old_value(v):
+        try:
+            if not re.search(r"\d-\d", v):
+                return float(v)
+            return float(sum(float(s) for s in v.split("-")) / len(v.split("-")))
+        except Exception:
+            return -999
+
+    @staticmethod
+    def _old_pair(v):
+        try:
+            return [float(s) for s in v.split("-")]
+        except Exception:
+            return [-999, -999]
+
+    def _parsed(self, values):
+        records = [{"value": v, "proteins": [], "references": []} for v in values]
+        rxn = self._reaction(temperature_optimum=records, temperature_range=records)
+        return (
+            [r["value"] for r in rxn.temperature["optimum"]],
+            [r["value"] for r in rxn.temperature["range"]],
+        )
+
+    def test_matches_former_parsers(self):
+        values = ["37", " 37 ", "0.5", ".5", "1.5E+2", "+4", "6-8", "6.5-7.5"]
+        values += ["", "oops", "low-high", "5-"]
+        points, pairs = self._parsed(values)
+        self.assertEqual(points, [self._old_value(v) for v in values])
+        self.assertEqual(pairs, [self._old_pair(v) for v in values])
+        # Spaced ranges were already read as pairs in range fields.
+        spaced = ["30 - 40", "5 -8", "7- 9"]
+        self.assertEqual(self._parsed(spaced)[1], [self._old_pair(v) for v in spaced])
+
+    def test_deliberate_differences_from_former_parsers(self):
+        values = ["30 - 40", "5 -8", "-5", "1e-3", "1e-3-3e-3"]
+        values += ["1-2-3", "nan", "inf", "1_000"]
+        points, pairs = self._parsed(values)
+        self.assertEqual(points, [35.0, 6.5, -5.0, 0.001, 0.002] + [-999] * 4)
+        self.assertEqual(
+            pairs,
+            [[30.0, 40.0], [5.0, 8.0], [-5.0], [0.001], [0.001, 0.003]]
+            + [[-999, -999]] * 4,
+        )
+
+
+@unittest.skipIf(pq is None, "pyarrow is not installed")
+class TestArrowExport(unittest.TestCase):
+    """Arrow tables and the partitioned Parquet dataset."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = BRENDA(FIXTURE)
+        cls.rxn = cls.db.reactions.get_by_id("1.1.1.304")
+        cls.tables = cls.db.to_arrow()
+
+    def test_one_table_per_field(self):
+        self.assertEqual(
+            set(self.tables), {"enzymes", "proteins", "references", *DATA_FIELDS}
+        )
+        self.assertEqual(self.tables["enzymes"].num_rows, len(self.db.reactions))
+        self.assertEqual(self.tables["proteins"].num_rows, 14)
+        for field in ("km_value", "cloned", "substrates_products"):
+            self.assertEqual(
+                self.tables[field].num_rows, len(self.rxn.field(field)), field
+            )
+
+    def test_records_are_resolved(self):
+        row = self.tables["km_value"].slice(0, 1).to_pylist()[0]
+        record = self.rxn.field("km_value")[0]
+        self.assertEqual(row["ec_class"], "1")
+        self.assertEqual(row["value"], record["value"])
+        self.assertEqual(sorted(row["organisms"]), sorted(record["organisms"]))
+        pmids = [self.rxn.bibliography[rid]["pmid"] for rid in row["reference_ids"]]
+        self.assertEqual(row["pmids"], pmids)
+
+    def test_scalar_history_goes_to_enzymes(self):
+        enzymes = {r["ec_number"]: r for r in self.tables["enzymes"].to_pylist()}
+        self.assertEqual(enzymes["6.6.99.99"]["history"], "internal dummy EC number")
+        self.assertEqual(self.tables["history"].num_rows, 0)
+
+    def test_parquet_dataset_layout(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = self.db.to_parquet(tmp, max_workers=4)
+            with open(os.path.join(tmp, "_brenda.json")) as fh:
+                manifest = json.load(fh)
+            self.assertEqual(manifest["release"], "2026.1")
+            self.assertEqual(manifest["tables"], list(self.tables))
+            self.assertTrue(
+                os.path.isfile(
+                    os.path.join(tmp, "km_value", "ec_class=1", "part-0.parquet")
+                )
+            )
+            km = pq.read_table(root / "km_value", memory_map=True)
+            self.assertEqual(
+                km.drop_columns(["ec_class"]).to_pylist(),
+                self.tables["km_value"].remove_column(0).to_pylist(),
+            )
+            self.assertEqual(pq.read_table(root / "history").num_rows, 0)
+
+
+@unittest.skipIf(pq is None, "pyarrow is not installed")
+class TestParquetBackend(unittest.TestCase):
+    """BRENDA opened from a Parquet dataset instead of the JSON."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.eager = BRENDA(FIXTURE)
+        cls.eager.to_parquet(cls.tmp.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_entries_round_trip(self):
+        with open(FIXTURE, encoding="utf-8") as fh:
+            data = json.load(fh)["data"]
+        db = BRENDA.from_parquet(self.tmp.name)
+        self.assertEqual(db.release, self.eager.release)
+        self.assertEqual(db.schema_version, self.eager.schema_version)
+        self.assertEqual(
+            [r.ec_number for r in db.reactions],
+            [r.ec_number for r in self.eager.reactions],
+        )
+        for rxn in db.reactions:
+            self.assertEqual(rxn._entry(), data[rxn.ec_number])
+
+    def test_entries_spanning_row_groups(self):
+        with open(FIXTURE, encoding="utf-8") as fh:
+            data = json.load(fh)["data"]
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch("brendapyrser.arrow.ROW_GROUP_SIZE", 3):
+                self.eager.to_parquet(tmp)
+            db = BRENDA.from_parquet(tmp)
+            for rxn in reversed(db.reactions):
+                self.assertEqual(rxn._entry(), data[rxn.ec_number])
+
+    def test_reactions_materialised_lazily(self):
+        db = BRENDA.from_parquet(self.tmp.name)
+        rxn = db.reactions.get_by_id("1.1.1.304")
+        self.assertFalse(rxn._is_loaded())
+        eager_rxn = self.eager.reactions.get_by_id("1.1.1.304")
+        self.assertEqual(rxn.KMvalues, eager_rxn.KMvalues)
+        self.assertEqual(rxn.organisms, eager_rxn.organisms)
+        self.assertTrue(rxn._is_loaded())
+
+    def test_not_a_dataset(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(ValueError):
+                BRENDA.from_parquet(tmp)
+
+
+class TestSQLiteBackend(unittest.TestCase):
+    """BRENDA opened from a SQLite database built from the JSON."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, "brenda.sqlite")
+        cls.eager = BRENDA(FIXTURE)
+        cls.eager.to_sqlite(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def setUp(self):
+        self.db = BRENDA.from_sqlite(self.path)
+
+    def test_entries_round_trip(self):
+        with open(FIXTURE, encoding="utf-8") as fh:
+            data = json.load(fh)["data"]
+        self.assertEqual(self.db.release, self.eager.release)
+        self.assertEqual(
+            [r.ec_number for r in self.db.reactions],
+            [r.ec_number for r in self.eager.reactions],
+        )
+        for rxn in self.db.reactions:
+            self.assertEqual(rxn._entry(), data[rxn.ec_number])
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_lookups_match_in_memory(self):
+        reactions, eager = self.db.reactions, self.eager.reactions
+        self.assertEqual(
+            reactions.get_by_id("1.1.1.304").KMvalues,
+            eager.get_by_id("1.1.1.304").KMvalues,
+        )
+        self.assertEqual(
+            reactions.get_by_name(eager[0].name.upper()).ec_number, "1.1.1.304"
+        )
+        with self.assertRaises(ValueError):
+            reactions.get_by_id("9.9.9.9")
+        with self.assertRaises(ValueError):
+            reactions.get_many(["1.1.1.304", "9.9.9.9"])
+        compounds = {
+            c
+            for mets in eager.get_by_id("1.1.1.304").substratesAndProducts
+            for c in mets["substrates"] + mets["products"]
+        }
+        for compound in sorted(compounds) + ["no such compound"]:
+            for method in ("filter_by_compound", "filter_by_substrate"):
+                self.assertEqual(
+                    [r.ec_number for r in getattr(reactions, method)(compound)],
+                    [r.ec_number for r in getattr(eager, method)(compound)],
+                )
+        for species in ("staphylococcus", "Rhodococcus", "st", '"', "no such organism"):
+            self.assertEqual(
+                [r.ec_number for r in reactions.filter_by_organism(species)],
+                [r.ec_number for r in eager.filter_by_organism(species)],
+            )
+        self.assertEqual(
+            sorted(self.db.getKMcompounds()), sorted(self.eager.getKMcompounds())
+        )
+        self.assertEqual(
+            sorted(self.db.getOrganisms()), sorted(self.eager.getOrganisms())
+        )
+
+    def test_organism_search_is_indexed(self):
+        from brendapyrser.sqlite import _Store
+
+        store = _Store(self.path)
+        queries = []
+        with mock.patch.object(
+            _Store, "_Store__query", lambda _, *query: queries.append(query) or []
+        ):
+            store.positions_with_organism("staphylococcus")
+        conn = sqlite3.connect(self.path)
+        try:
+            plan = [
+                row[3]
+                for sql, params in queries
+                for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            ]
+        finally:
+            conn.close()
+        self.assertTrue(any(step.startswith("SCAN o VIRTUAL TABLE") for step in plan))
+        self.assertIn(
+            "SEARCH p USING COVERING INDEX proteins_organism (organism_key=?)", plan
+        )
+
+    def test_modified_list_falls_back_to_memory(self):
+        reactions = self.db.reactions
+        reactions.pop(0)
+        with self.assertRaises(ValueError):
+            reactions.get_by_id("1.1.1.304")
+        self.assertEqual(reactions.get_by_id("6.6.99.99").ec_number, "6.6.99.99")
+        self.assertIsNotNone(self.db.reactions._store)
+        self.assertEqual(
+            self.db.reactions.get_by_id("1.1.1.304").ec_number, "1.1.1.304"
+        )
+
+    def test_protein_without_organism(self):
+        with open(FIXTURE, encoding="utf-8") as fh:
+            document = json.load(fh)
+        protein = next(iter(document["data"]["1.1.1.304"]["protein"].values()))
+        del protein["organism"]
+        source = os.path.join(self.tmp.name, "no_organism.json")
+        path = os.path.join(self.tmp.name, "no_organism.sqlite")
+        with open(source, "w", encoding="utf-8") as fh:
+            json.dump(document, fh)
+        eager = BRENDA(source)
+        eager.to_sqlite(path)
+        self.assertEqual(
+            sorted(BRENDA.from_sqlite(path).getOrganisms()),
+            sorted(eager.getOrganisms()),
+        )
+
+    def test_not_a_database(self):
+        with self.assertRaises(ValueError):
+            BRENDA.from_sqlite(FIXTURE)
+        with self.assertRaises(ValueError):
+            BRENDA.from_sqlite(os.path.join(self.tmp.name, "missing.sqlite"))
+
+
+class TestValueParsing(unittest.TestCase):
+    """Batch parsing of value strings into arrays."""
+
+    def test_single_values_and_ranges(self):
+        parsed = parse_values(["0.045", "6-8", "1.2e-3", "-5", "0.2-0.5"])
+        self.assertEqual(parsed.value.tolist(), [0.045, 7.0, 0.0012, -5.0, 0.35])
+        self.assertEqual(parsed.low.tolist(), [0.045, 6.0, 0.0012, -5.0, 0.2])
+        self.assertEqual(parsed.high.tolist(), [0.045, 8.0, 0.0012, -5.0, 0.5])
+        self.assertEqual(parsed.is_range.tolist(), [False, True, False, False, True])
+        self.assertTrue(parsed.valid.all())
+
+    def test_invalid_strings_are_masked(self):
+        parsed = parse_values(["oops", "low-high", "", None, " 3 "])
+        self.assertEqual(parsed.valid.tolist(), [False, False, False, False, True])
+        self.assertEqual(parsed.value[4], 3.0)
+        self.assertTrue(all(v != v for v in parsed.value[:4].tolist()))
+
+    def test_empty_input(self):
+        parsed = parse_values([])
+        self.assertEqual(len(parsed.value), 0)
+        self.assertEqual(parsed.valid.dtype, bool)
+
 
 class TestDisplay(unittest.TestCase):
     """Jupyter/summary rendering helpers."""